@@ -15,6 +15,12 @@ from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 优先使用LibYAML的C实现解析器，不可用时回退到纯Python实现
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 class ConfigLoader:
     """配置加载器"""
@@ -183,7 +189,7 @@ class ConfigLoader:
             file_path = config_dir / config_file
             try:
                 with open(file_path, "r", encoding="utf-8") as f:
-                    file_config = yaml.safe_load(f)
+                    file_config = yaml.load(f, Loader=_SafeLoader)
                 
                 if file_config:
                     merged_config = self._deep_merge(merged_config, file_config)
@@ -6,7 +6,7 @@ import os
 import threading
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, Callable, List
+from typing import Dict, Any, Optional, Union, Callable, List, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from threading import Lock, RLock
@@ -20,6 +20,12 @@ import yaml
 
 logger = get_logger(__name__)
 
+# 优先使用LibYAML的C实现输出器，不可用时回退到纯Python实现
+try:
+    from yaml import CDumper as _Dumper
+except ImportError:
+    from yaml import Dumper as _Dumper
+
 
 @dataclass
 class ConfigWatchInfo:
@@ -162,29 +168,7 @@ class ConfigManager:
         """
         with self._config_lock:
             try:
-                # 获取当前配置对象
-                config_obj = self._config
-                parts = key.split(".")
-                
-                # 遍历到最后一个部分的前一个对象
-                for i, part in enumerate(parts[:-1]):
-                    if hasattr(config_obj, part):
-                        config_obj = getattr(config_obj, part)
-                    elif isinstance(config_obj, dict) and part in config_obj:
-                        config_obj = config_obj[part]
-                    else:
-                        # 路径不存在，创建嵌套字典？（暂不支持）
-                        logger.warning("配置路径不存在", key=key, part=part)
-                        return False
-                
-                last_part = parts[-1]
-                # 设置值
-                if hasattr(config_obj, last_part):
-                    setattr(config_obj, last_part, value)
-                elif isinstance(config_obj, dict):
-                    config_obj[last_part] = value
-                else:
-                    logger.warning("配置路径不可设置", key=key)
+                if not self._assign_value(key, value):
                     return False
                 
                 # 触发配置变更事件
@@ -195,13 +179,92 @@ class ConfigManager:
                 if persistent:
                     self._save_to_file()
                 
-                logger.info("配置值设置成功", key=key, value=value, persistent=persistent)
+                logger.info_struct("配置值设置成功", key=key, value=value, persistent=persistent)
                 return True
                 
             except Exception as e:
-                logger.error("配置值设置失败", key=key, error=str(e))
+                logger.error_struct("配置值设置失败", key=key, error=str(e))
                 return False
     
+    def set_values(self, items: List[Tuple[str, Any]], persistent: bool = False) -> Dict[str, bool]:
+        """
+        批量设置配置值
+        
+        全部设置完成后只触发一次配置变更通知，持久化时只写一次配置文件。
+        
+        Args:
+            items: (配置键, 配置值) 列表，键格式同set_value
+            persistent: 是否持久化到配置文件
+            
+        Returns:
+            各配置键是否设置成功
+        """
+        results: Dict[str, bool] = {}
+        with self._config_lock:
+            for key, value in items:
+                try:
+                    results[key] = self._assign_value(key, value)
+                except Exception as e:
+                    logger.error_struct("配置值设置失败", key=key, error=str(e))
+                    results[key] = False
+            
+            if any(results.values()):
+                try:
+                    # 触发配置变更事件
+                    old_config = self._config
+                    self._on_config_changed(old_config, self._config)
+                    
+                    # 如果需要持久化，保存到文件
+                    if persistent:
+                        self._save_to_file()
+                except Exception as e:
+                    logger.error_struct("批量配置值设置失败", error=str(e))
+                    return dict.fromkeys(results, False)
+            
+            logger.info_struct("批量配置值设置完成",
+                       total=len(results),
+                       succeeded=sum(results.values()),
+                       persistent=persistent)
+            return results
+    
+    def _assign_value(self, key: str, value: Any) -> bool:
+        """
+        按点号分隔的键写入当前配置对象（调用方需持有配置锁）
+        
+        Args:
+            key: 配置键
+            value: 配置值
+            
+        Returns:
+            是否写入成功
+        """
+        # 获取当前配置对象
+        config_obj = self._config
+        parts = key.split(".")
+        
+        # 遍历到最后一个部分的前一个对象
+        for i, part in enumerate(parts[:-1]):
+            if hasattr(config_obj, part):
+                config_obj = getattr(config_obj, part)
+            elif isinstance(config_obj, dict) and part in config_obj:
+                config_obj = config_obj[part]
+            else:
+                # 路径不存在，创建嵌套字典？（暂不支持）
+                logger.warning_struct("配置路径不存在", key=key, part=part)
+                return False
+        
+        last_part = parts[-1]
+        # 设置值
+        if hasattr(config_obj, last_part):
+            setattr(config_obj, last_part, value)
+        elif isinstance(config_obj, dict):
+            config_obj[last_part] = value
+        else:
+            logger.warning_struct("配置路径不可设置", key=key)
+            return False
+        
+        return True
+    
     def _save_to_file(self) -> bool:
         """
         将当前配置保存到文件
@@ -212,11 +275,11 @@ class ConfigManager:
         try:
             config_dict = self._config.model_dump()
             with open(self._config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config_dict, f, allow_unicode=True, default_flow_style=False)
-            logger.info("配置保存成功", config_path=str(self._config_path))
+                yaml.dump(config_dict, f, Dumper=_Dumper, allow_unicode=True, default_flow_style=False)
+            logger.info_struct("配置保存成功", config_path=str(self._config_path))
             return True
         except Exception as e:
-            logger.error("配置保存失败", config_path=str(self._config_path), error=str(e))
+            logger.error_struct("配置保存失败", config_path=str(self._config_path), error=str(e))
             return False
     
     def reload(self, force: bool = False) -> bool:
@@ -245,7 +308,7 @@ class ConfigManager:
                 return True
                 
             except Exception as e:
-                logger.error("配置重新加载失败", exc_info=True)
+                logger.error_struct("配置重新加载失败", exc_info=True)
                 return False
     
     def subscribe(self, callback: Callable[[SmallPanguConfig], None]) -> str:
@@ -266,11 +329,11 @@ class ConfigManager:
             try:
                 callback(new_config)
             except Exception as e:
-                logger.error("配置变更回调执行失败", callback_id=callback_id, exc_info=True)
+                logger.error_struct("配置变更回调执行失败", callback_id=callback_id, exc_info=True)
         
         # 存储回调（实际实现使用包装版本）
         self._callbacks.append(wrapped_callback)
-        logger.debug("配置变更订阅已添加", callback_id=callback_id)
+        logger.debug_struct("配置变更订阅已添加", callback_id=callback_id)
         
         return callback_id
     
@@ -285,13 +348,13 @@ class ConfigManager:
             是否取消成功
         """
         # TODO: 基于ID实现取消订阅
-        logger.warning("配置变更取消订阅功能暂未完全实现", callback_id=callback_id)
+        logger.warning_struct("配置变更取消订阅功能暂未完全实现", callback_id=callback_id)
         return False
     
     def _on_config_changed(self, old_config: SmallPanguConfig, new_config: SmallPanguConfig):
         """处理配置变更"""
         # 记录变更
-        logger.info("配置已变更", environment=new_config.environment)
+        logger.info_struct("配置已变更", environment=new_config.environment)
         
         # 触发事件总线事件
         if self._event_bus:
@@ -311,7 +374,7 @@ class ConfigManager:
             try:
                 callback(new_config)
             except Exception as e:
-                logger.error("配置变更回调执行失败", exc_info=True)
+                logger.error_struct("配置变更回调执行失败", exc_info=True)
     
     def _start_watching(self):
         """开始监视配置文件变更"""
@@ -335,7 +398,7 @@ class ConfigManager:
         )
         self._watch_thread.start()
         
-        logger.info("配置热重载监视已启动", files=list(self._watched_files.keys()))
+        logger.info_struct("配置热重载监视已启动", files=list(self._watched_files.keys()))
     
     def _collect_watch_files(self):
         """收集要监视的配置文件"""
@@ -369,7 +432,7 @@ class ConfigManager:
             )
             self._watched_files[str(file_path)] = watch_info
         except Exception as e:
-            logger.error("添加配置文件监视失败", file=str(file_path), exc_info=True)
+            logger.error_struct("添加配置文件监视失败", file=str(file_path), exc_info=True)
     
     def _watch_loop(self):
         """监视循环"""
@@ -383,7 +446,7 @@ class ConfigManager:
                 changed_files = self._check_file_changes()
                 
                 if changed_files:
-                    logger.info("检测到配置文件变更", files=changed_files)
+                    logger.info_struct("检测到配置文件变更", files=changed_files)
                     
                     # 重新加载配置
                     success = self.reload(force=True)
@@ -395,7 +458,7 @@ class ConfigManager:
                         logger.warning("配置文件变更但重新加载失败")
                         
             except Exception as e:
-                logger.error("配置监视循环异常", exc_info=True)
+                logger.error_struct("配置监视循环异常", exc_info=True)
                 time.sleep(self._watch_interval * 2)  # 发生错误时等待更长时间
         
         logger.debug("配置监视循环结束")
@@ -410,7 +473,7 @@ class ConfigManager:
                 
                 try:
                     if not file_path.exists():
-                        logger.warning("监视的配置文件已删除", file=str(file_path))
+                        logger.warning_struct("监视的配置文件已删除", file=str(file_path))
                         self._watched_files.pop(file_path_str, None)
                         changed_files.append(str(file_path))
                         continue
@@ -430,7 +493,7 @@ class ConfigManager:
                         changed_files.append(str(file_path))
                         
                 except Exception as e:
-                    logger.error("检查配置文件变更失败", file=str(file_path), exc_info=True)
+                    logger.error_struct("检查配置文件变更失败", file=str(file_path), exc_info=True)
         
         return changed_files
     
@@ -296,6 +296,24 @@ class EventBus:
             else:
                 return sum(len(subs) for subs in self._subscribers.values())
     
+    def has_subscribers(self, event_type: str) -> bool:
+        """
+        检查事件类型是否有订阅者（包括通配符订阅）
+        
+        发布方可据此跳过无人监听事件的数据构造和发布。
+        
+        Args:
+            event_type: 事件类型
+            
+        Returns:
+            是否存在匹配的订阅者
+        """
+        with self._lock:
+            return any(
+                subscribers and self._match_event_type(event_type, pattern)
+                for pattern, subscribers in self._subscribers.items()
+            )
+    
     def __str__(self) -> str:
         """字符串表示"""
         count = self.get_subscriber_count()
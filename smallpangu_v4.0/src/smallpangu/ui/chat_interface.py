@@ -27,6 +27,9 @@ from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 键盘事件状态中Ctrl键的掩码
+_CTRL_MASK = 0x4
+
 
 class MessageRole(str, Enum):
     """消息角色枚举"""
@@ -245,9 +248,8 @@ class ChatInterface(BaseWidget):
         input_text_widget = self._input_text.get_widget()
         input_text_widget.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
         
-        # 绑定回车键发送消息（Ctrl+Enter换行）
+        # 绑定回车键发送消息（Ctrl+Enter换行，由同一处理函数区分）
         input_text_widget.bind("<Return>", self._on_input_return_key)
-        input_text_widget.bind("<Control-Return>", self._on_input_ctrl_return)
         
         # 创建发送按钮
         button_style = {
@@ -289,7 +291,7 @@ class ChatInterface(BaseWidget):
             事件处理结果
         """
         # Ctrl+Enter是换行，单独的Enter是发送
-        if event.state & 0x4:  # Ctrl键
+        if event.state & _CTRL_MASK:
             # 插入换行符
             widget = self._input_text.get_widget()
             if widget:
@@ -300,11 +302,6 @@ class ChatInterface(BaseWidget):
             self._send_current_message()
             return "break"
     
-    def _on_input_ctrl_return(self, event) -> str:
-        """处理Ctrl+Enter事件（插入换行）"""
-        # 这个事件由_on_input_return_key处理
-        return "break"
-    
     def _on_send_button_click(self) -> None:
         """处理发送按钮点击"""
         self._send_current_message()
@@ -536,6 +533,9 @@ class ChatInterface(BaseWidget):
         """清空所有消息"""
         logger.debug("清空所有消息")
         
+        # 在清空前记录消息数量（欢迎消息会在清空后重新加入）
+        total_cleared = len(self._messages)
+        
         # 销毁所有消息组件
         for widget in self._message_widgets.values():
             widget.destroy()
@@ -551,7 +551,7 @@ class ChatInterface(BaseWidget):
         if self._event_bus:
             self._event_bus.publish("chat.messages.cleared", {
                 "timestamp": time.time(),
-                "total_cleared": len(self._messages)
+                "total_cleared": total_cleared
             })
     
     def get_messages(self, limit: Optional[int] = None) -> List[ChatMessage]:
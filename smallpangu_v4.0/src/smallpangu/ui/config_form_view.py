@@ -3,14 +3,18 @@
 
 基于ConfigFormService生成的FormConfig动态渲染配置表单。
 支持多种字段类型、实时验证、条件显示等高级功能。
+
+性能说明：本模块只做组件装配和标量值转换，没有数值循环，
+不适用Numba等JIT编译（单次调用的分派开销反而高于内置int/float）。
+优化应集中在减少组件创建和布局次数上。
 """
 
 import customtkinter as ctk
 import logging
-from typing import Dict, Any, Optional, List, Tuple, Callable, Union
+from typing import Dict, Any, Optional, List, Set, Tuple, Callable, Union
 from dataclasses import dataclass
 
-from .widgets import BaseWidget, Panel, ScrollPanel, Label, InputField, Switch, Dropdown, TextArea, Button, WidgetStyle
+from .widgets import BaseWidget, Panel, ScrollPanel, Label, InputField, Switch, Dropdown, TextArea, Button, WidgetStyle, _DATACLASS_SLOTS
 from ..services.config_form_service import FormConfig, FormSection, FormField, FormFieldType, ValidationLevel
 from ..core.events import EventBus
 from ..config.manager import ConfigManager
@@ -18,8 +22,46 @@ from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 字段控件样式（模块级共享，组件内部会复制为WidgetStyle，不会修改这些字典）
+_INPUT_FIELD_STYLE: Dict[str, Any] = {
+    "font": ("Segoe UI", 11),
+    "bg_color": "#ffffff",
+    "border_color": "#ced4da",
+    "border_width": 1,
+    "corner_radius": 4,
+    "padding": (8, 8)
+}
 
-@dataclass
+_TEXTAREA_FIELD_STYLE: Dict[str, Any] = {
+    "font": ("Consolas", 10),
+    "bg_color": "#ffffff",
+    "border_color": "#ced4da",
+    "border_width": 1,
+    "corner_radius": 4,
+    "height": 120
+}
+
+_CODE_FIELD_STYLE: Dict[str, Any] = {
+    "font": ("Consolas", 10),
+    "bg_color": "#f8f9fa",
+    "border_color": "#ced4da",
+    "border_width": 1,
+    "corner_radius": 4,
+    "height": 180
+}
+
+_SWITCH_FIELD_STYLE: Dict[str, Any] = {
+    "font": ("Segoe UI", 11),
+    "text_color": "#212529",
+    "padding": (0, 8)
+}
+
+# 未渲染分区占位高度的估算值（像素）
+_SECTION_HEADER_HEIGHT = 64
+_FIELD_ROW_HEIGHT = 72
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class FieldValidationResult:
     """字段验证结果"""
     field_id: str
@@ -27,7 +69,7 @@ class FieldValidationResult:
     message: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class FormValidationResult:
     """表单验证结果"""
     is_valid: bool
@@ -35,59 +77,83 @@ class FormValidationResult:
     values: Dict[str, Any]
 
 
+@dataclass
+class _FieldBinding:
+    """字段绑定 - UI组件、字段定义及注册时解析好的存取方法"""
+    widget: BaseWidget
+    field: FormField
+    get_value: Optional[Callable[[], Any]]
+    set_value: Optional[Callable[[Any], None]]
+    set_state: Optional[Callable[[Any], None]]
+
+
+def _to_text(raw_value: Any) -> str:
+    """转换为字符串，空值返回空串"""
+    return str(raw_value) if raw_value else ""
+
+
+def _to_optional_text(raw_value: Any) -> Optional[str]:
+    """转换为字符串，空值返回None"""
+    return str(raw_value) if raw_value else None
+
+
+def _to_text_list(raw_value: Any) -> List[str]:
+    """转换为字符串列表"""
+    return [str(raw_value)] if raw_value else []
+
+
+def _to_float(raw_value: Any) -> Optional[float]:
+    """转换为浮点数，无法转换时返回None"""
+    try:
+        return float(raw_value) if raw_value else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_int(raw_value: Any) -> Optional[int]:
+    """转换为整数，无法转换时返回None"""
+    try:
+        return int(raw_value) if raw_value else None
+    except (ValueError, TypeError):
+        return None
+
+
 class FieldRenderer:
     """字段渲染器 - 将FormField转换为UI组件"""
     
     def __init__(self, parent, config_manager: Optional[ConfigManager] = None):
         self._parent = parent
         self._config_manager = config_manager
+        # 组件缓存: field_id -> UI组件
         self._widget_cache: Dict[str, BaseWidget] = {}
         
     def render_field(self, field: FormField) -> Optional[BaseWidget]:
         """渲染字段为UI组件"""
         try:
-            widget_id = f"field_{field.id}"
+            # 检查缓存（以字段ID为键）
+            cached = self._widget_cache.get(field.id)
+            if cached is not None:
+                return cached
             
-            # 检查缓存
-            if widget_id in self._widget_cache:
-                return self._widget_cache[widget_id]
-            
-            widget = None
+            widget_id = f"field_{field.id}"
             
-            # 根据字段类型创建对应的UI组件
-            if field.field_type == FormFieldType.TEXT:
-                widget = self._create_text_field(field, widget_id)
-            elif field.field_type == FormFieldType.TEXTAREA:
-                widget = self._create_textarea_field(field, widget_id)
-            elif field.field_type == FormFieldType.CODE:
-                widget = self._create_code_field(field, widget_id)
-            elif field.field_type == FormFieldType.NUMBER:
-                widget = self._create_number_field(field, widget_id)
-            elif field.field_type == FormFieldType.INTEGER:
-                widget = self._create_integer_field(field, widget_id)
-            elif field.field_type == FormFieldType.BOOLEAN:
-                widget = self._create_boolean_field(field, widget_id)
-            elif field.field_type == FormFieldType.SELECT:
-                widget = self._create_select_field(field, widget_id)
-            elif field.field_type == FormFieldType.MULTISELECT:
-                widget = self._create_multiselect_field(field, widget_id)
-            elif field.field_type == FormFieldType.SLIDER:
-                widget = self._create_slider_field(field, widget_id)
-            elif field.field_type == FormFieldType.COLOR:
-                widget = self._create_color_field(field, widget_id)
+            # 根据字段类型查表创建对应的UI组件
+            creator = self._RENDERERS.get(field.field_type)
+            if creator is not None:
+                widget = creator(self, field, widget_id)
             else:
                 # 默认使用文本字段
                 widget = self._create_text_field(field, widget_id)
-                logger.warning(f"不支持的字段类型: {field.field_type}, 使用文本字段替代")
+                logger.warning("不支持的字段类型: %s, 使用文本字段替代", field.field_type)
             
             if widget:
-                self._widget_cache[widget_id] = widget
+                self._widget_cache[field.id] = widget
                 self._apply_field_styling(widget, field)
             
             return widget
             
         except Exception as e:
-            logger.error(f"字段渲染失败: {field.id} - {e}", exc_info=True)
+            logger.error("字段渲染失败: %s - %s", field.id, e)
             return None
     
     def _create_text_field(self, field: FormField, widget_id: str) -> InputField:
@@ -96,14 +162,7 @@ class FieldRenderer:
             self._parent,
             widget_id=widget_id,
             placeholder=field.placeholder or "",
-            style={
-                "font": ("Segoe UI", 11),
-                "bg_color": "#ffffff",
-                "border_color": "#ced4da",
-                "border_width": 1,
-                "corner_radius": 4,
-                "padding": (8, 8)
-            }
+            style=_INPUT_FIELD_STYLE
         )
     
     def _create_textarea_field(self, field: FormField, widget_id: str) -> TextArea:
@@ -111,14 +170,7 @@ class FieldRenderer:
         return TextArea(
             self._parent,
             widget_id=widget_id,
-            style={
-                "font": ("Consolas", 10),
-                "bg_color": "#ffffff",
-                "border_color": "#ced4da",
-                "border_width": 1,
-                "corner_radius": 4,
-                "height": 120
-            }
+            style=_TEXTAREA_FIELD_STYLE
         )
     
     def _create_code_field(self, field: FormField, widget_id: str) -> TextArea:
@@ -126,14 +178,7 @@ class FieldRenderer:
         return TextArea(
             self._parent,
             widget_id=widget_id,
-            style={
-                "font": ("Consolas", 10),
-                "bg_color": "#f8f9fa",
-                "border_color": "#ced4da",
-                "border_width": 1,
-                "corner_radius": 4,
-                "height": 180
-            }
+            style=_CODE_FIELD_STYLE
         )
     
     def _create_number_field(self, field: FormField, widget_id: str) -> InputField:
@@ -142,14 +187,7 @@ class FieldRenderer:
             self._parent,
             widget_id=widget_id,
             placeholder=field.placeholder or "",
-            style={
-                "font": ("Segoe UI", 11),
-                "bg_color": "#ffffff",
-                "border_color": "#ced4da",
-                "border_width": 1,
-                "corner_radius": 4,
-                "padding": (8, 8)
-            }
+            style=_INPUT_FIELD_STYLE
         )
     
     def _create_integer_field(self, field: FormField, widget_id: str) -> InputField:
@@ -158,14 +196,7 @@ class FieldRenderer:
             self._parent,
             widget_id=widget_id,
             placeholder=field.placeholder or "",
-            style={
-                "font": ("Segoe UI", 11),
-                "bg_color": "#ffffff",
-                "border_color": "#ced4da",
-                "border_width": 1,
-                "corner_radius": 4,
-                "padding": (8, 8)
-            }
+            style=_INPUT_FIELD_STYLE
         )
     
     def _create_boolean_field(self, field: FormField, widget_id: str) -> Switch:
@@ -174,11 +205,7 @@ class FieldRenderer:
             self._parent,
             text=field.name,
             widget_id=widget_id,
-            style={
-                "font": ("Segoe UI", 11),
-                "text_color": "#212529",
-                "padding": (0, 8)
-            }
+            style=_SWITCH_FIELD_STYLE
         )
     
     def _create_select_field(self, field: FormField, widget_id: str) -> Dropdown:
@@ -189,14 +216,7 @@ class FieldRenderer:
             options=options,
             widget_id=widget_id,
             default_value=str(field.default_value) if field.default_value else None,
-            style={
-                "font": ("Segoe UI", 11),
-                "bg_color": "#ffffff",
-                "border_color": "#ced4da",
-                "border_width": 1,
-                "corner_radius": 4,
-                "padding": (8, 8)
-            }
+            style=_INPUT_FIELD_STYLE
         )
     
     def _create_multiselect_field(self, field: FormField, widget_id: str) -> Dropdown:
@@ -207,14 +227,7 @@ class FieldRenderer:
             options=options,
             widget_id=widget_id,
             default_value=str(field.default_value) if field.default_value else None,
-            style={
-                "font": ("Segoe UI", 11),
-                "bg_color": "#ffffff",
-                "border_color": "#ced4da",
-                "border_width": 1,
-                "corner_radius": 4,
-                "padding": (8, 8)
-            }
+            style=_INPUT_FIELD_STYLE
         )
     
     def _create_slider_field(self, field: FormField, widget_id: str) -> InputField:
@@ -223,14 +236,7 @@ class FieldRenderer:
             self._parent,
             widget_id=widget_id,
             placeholder=field.placeholder or "输入数值",
-            style={
-                "font": ("Segoe UI", 11),
-                "bg_color": "#ffffff",
-                "border_color": "#ced4da",
-                "border_width": 1,
-                "corner_radius": 4,
-                "padding": (8, 8)
-            }
+            style=_INPUT_FIELD_STYLE
         )
     
     def _create_color_field(self, field: FormField, widget_id: str) -> InputField:
@@ -239,14 +245,7 @@ class FieldRenderer:
             self._parent,
             widget_id=widget_id,
             placeholder="#RRGGBB 或颜色名称",
-            style={
-                "font": ("Segoe UI", 11),
-                "bg_color": "#ffffff",
-                "border_color": "#ced4da",
-                "border_width": 1,
-                "corner_radius": 4,
-                "padding": (8, 8)
-            }
+            style=_INPUT_FIELD_STYLE
         )
     
     def _apply_field_styling(self, widget: BaseWidget, field: FormField) -> None:
@@ -256,7 +255,7 @@ class FieldRenderer:
             try:
                 widget.set_value(field.value if field.value is not None else "")
             except Exception as e:
-                logger.warning(f"设置字段值失败 {field.id}: {e}")
+                logger.warning("设置字段值失败 %s: %s", field.id, e)
         
         # 禁用状态
         if not field.enabled or field.read_only:
@@ -267,57 +266,72 @@ class FieldRenderer:
             try:
                 widget.update_style(**field.style)
             except Exception as e:
-                logger.warning(f"应用自定义样式失败 {field.id}: {e}")
+                logger.warning("应用自定义样式失败 %s: %s", field.id, e)
     
-    def get_field_value(self, widget: BaseWidget, field_type: FormFieldType) -> Any:
-        """从UI组件获取字段值"""
-        if not hasattr(widget, 'get_value'):
+    def get_field_value(self, get_value: Optional[Callable[[], Any]], field_type: FormFieldType) -> Any:
+        """通过预先绑定的get_value方法获取字段值并按类型转换"""
+        if get_value is None:
             return None
         
         try:
-            raw_value = widget.get_value()
+            raw_value = get_value()
             
             # 根据字段类型转换值
-            if field_type == FormFieldType.TEXT:
-                return str(raw_value) if raw_value else ""
-            elif field_type == FormFieldType.TEXTAREA:
-                return str(raw_value) if raw_value else ""
-            elif field_type == FormFieldType.CODE:
-                return str(raw_value) if raw_value else ""
-            elif field_type == FormFieldType.NUMBER:
-                try:
-                    return float(raw_value) if raw_value else None
-                except (ValueError, TypeError):
-                    return None
-            elif field_type == FormFieldType.INTEGER:
-                try:
-                    return int(raw_value) if raw_value else None
-                except (ValueError, TypeError):
-                    return None
-            elif field_type == FormFieldType.BOOLEAN:
-                return bool(raw_value)
-            elif field_type == FormFieldType.SELECT:
-                return str(raw_value) if raw_value else None
-            elif field_type == FormFieldType.MULTISELECT:
-                # TODO: 实现真正的多选值获取
-                return [str(raw_value)] if raw_value else []
-            elif field_type == FormFieldType.SLIDER:
-                try:
-                    return float(raw_value) if raw_value else None
-                except (ValueError, TypeError):
-                    return None
-            elif field_type == FormFieldType.COLOR:
-                return str(raw_value) if raw_value else ""
-            else:
+            converter = self._VALUE_CONVERTERS.get(field_type)
+            if converter is None:
                 return raw_value
+            return converter(raw_value)
                 
         except Exception as e:
-            logger.error(f"获取字段值失败: {e}", exc_info=True)
+            logger.error("获取字段值失败: %s", e)
             return None
     
+    def is_cached(self, field_id: str) -> bool:
+        """字段组件是否已缓存"""
+        return field_id in self._widget_cache
+    
+    def refresh_field(self, widget: BaseWidget, field: FormField) -> None:
+        """用新的字段定义刷新已缓存组件的值和状态"""
+        if field.enabled and not field.read_only:
+            widget.set_state("normal")
+        self._apply_field_styling(widget, field)
+    
+    def evict(self, field_id: str) -> Optional[BaseWidget]:
+        """从缓存中移除字段组件"""
+        return self._widget_cache.pop(field_id, None)
+    
     def clear_cache(self) -> None:
         """清除组件缓存"""
         self._widget_cache.clear()
+    
+    # 字段类型 -> 组件创建方法（未绑定函数，调用时传入self）
+    _RENDERERS: Dict[FormFieldType, Callable[..., BaseWidget]] = {
+        FormFieldType.TEXT: _create_text_field,
+        FormFieldType.TEXTAREA: _create_textarea_field,
+        FormFieldType.CODE: _create_code_field,
+        FormFieldType.NUMBER: _create_number_field,
+        FormFieldType.INTEGER: _create_integer_field,
+        FormFieldType.BOOLEAN: _create_boolean_field,
+        FormFieldType.SELECT: _create_select_field,
+        FormFieldType.MULTISELECT: _create_multiselect_field,
+        FormFieldType.SLIDER: _create_slider_field,
+        FormFieldType.COLOR: _create_color_field,
+    }
+    
+    # 字段类型 -> 值转换函数
+    _VALUE_CONVERTERS: Dict[FormFieldType, Callable[[Any], Any]] = {
+        FormFieldType.TEXT: _to_text,
+        FormFieldType.TEXTAREA: _to_text,
+        FormFieldType.CODE: _to_text,
+        FormFieldType.NUMBER: _to_float,
+        FormFieldType.INTEGER: _to_int,
+        FormFieldType.BOOLEAN: bool,
+        FormFieldType.SELECT: _to_optional_text,
+        # TODO: 实现真正的多选值获取
+        FormFieldType.MULTISELECT: _to_text_list,
+        FormFieldType.SLIDER: _to_float,
+        FormFieldType.COLOR: _to_text,
+    }
 
 
 class ConfigFormView(BaseWidget):
@@ -370,12 +384,23 @@ class ConfigFormView(BaseWidget):
         self._sections_panel: Optional[Panel] = None
         self._button_panel: Optional[Panel] = None
         
-        # 字段映射: field_id -> (UI组件, FormField实例)
-        self._field_widgets: Dict[str, Tuple[BaseWidget, FormField]] = {}
+        # 字段映射: field_id -> 字段绑定（UI组件、FormField实例及其存取方法）
+        self._field_widgets: Dict[str, _FieldBinding] = {}
         
-        # 验证状态
+        # 验证状态: field_id -> 最近一次字段验证的错误信息
         self._validation_errors: Dict[str, str] = {}
         
+        # 脏字段跟踪: 只有被用户修改过的字段才需要重新读取和验证
+        self._dirty_fields: Set[str] = set()
+        self._field_values: Dict[str, Any] = {}
+        
+        # 延迟渲染: section_id -> (分区, 占位容器)，进入可视区域后才创建字段组件
+        self._pending_sections: Dict[str, Tuple[FormSection, Panel]] = {}
+        self._visible_check_scheduled = False
+        
+        # 渲染时直接添加到分区容器/按钮面板的组件，重新渲染前需要销毁
+        self._form_children: List[Tuple[Panel, BaseWidget]] = []
+        
         # 初始化
         self.initialize()
     
@@ -394,6 +419,7 @@ class ConfigFormView(BaseWidget):
             widget_id=f"{self.widget_id}_scroll",
             style={"orientation": "vertical", "fill": "both", "expand": True}
         )
+        self._scroll_panel.add_scroll_listener(self._schedule_visible_sections_render)
         
         # 分区容器
         self._sections_panel = Panel(
@@ -418,25 +444,70 @@ class ConfigFormView(BaseWidget):
     def set_form_config(self, form_config: FormConfig) -> None:
         """设置表单配置并重新渲染"""
         self._form_config = form_config
+        
+        # 清除现有内容（必须在清空字段映射之前进行），ID和类型都未变化的字段组件会被复用
+        new_fields = {
+            field.id: field
+            for section in form_config.sections
+            for field in section.fields
+        }
+        self._clear_form_widgets(new_fields)
+        
         self._field_widgets.clear()
         self._validation_errors.clear()
-        
-        # 清除现有内容
-        if self._sections_panel and hasattr(self._sections_panel, 'remove_widget'):
-            # 移除所有子组件
-            for child_id, (widget, _) in list(self._field_widgets.items()):
-                self._sections_panel.remove_widget(widget)
+        self._dirty_fields.clear()
+        self._field_values.clear()
+        self._pending_sections.clear()
         
         # 重新渲染
         self._render_form()
     
+    def _add_form_child(self, panel: Panel, child_widget: BaseWidget) -> None:
+        """添加组件到面板并记录，以便重新渲染时销毁"""
+        panel.add_widget(child_widget)
+        self._form_children.append((panel, child_widget))
+    
+    def _clear_form_widgets(self, keep_fields: Optional[Dict[str, FormField]] = None) -> None:
+        """
+        移除并销毁上一次渲染创建的组件
+        
+        Args:
+            keep_fields: 新表单的字段（field_id -> FormField），ID和类型相同的字段组件保留在缓存中复用
+        """
+        keep_fields = keep_fields or {}
+        suspended = self._suspend_layout()
+        
+        try:
+            # 字段组件的Tk父组件不是分区容器，需要单独处理
+            for field_id, binding in self._field_widgets.items():
+                new_field = keep_fields.get(field_id)
+                if new_field is not None and new_field.field_type == binding.field.field_type:
+                    # 复用的组件只从布局中移除，重新渲染时再添加
+                    field_tk_widget = binding.widget.get_widget()
+                    if field_tk_widget is not None:
+                        field_tk_widget.pack_forget()
+                    continue
+                
+                self._field_renderer.evict(field_id)
+                binding.widget.destroy()
+            
+            for panel, child_widget in self._form_children:
+                panel.remove_widget(child_widget)
+                child_widget.destroy()
+            self._form_children.clear()
+        finally:
+            self._resume_layout(suspended)
+    
     def _render_form(self) -> None:
         """渲染表单"""
         if not self._form_config or not self._sections_panel:
             return
         
+        # 渲染期间暂停容器尺寸传播，避免每添加一个子组件都触发一次重新布局
+        suspended = self._suspend_layout()
+        
         try:
-            logger.info(f"渲染表单: {self._form_config.title}")
+            logger.info("渲染表单: %s", self._form_config.title)
             
             # 渲染标题
             title_label = Label(
@@ -449,7 +520,7 @@ class ConfigFormView(BaseWidget):
                     "padding": (0, 0, 0, 16)
                 }
             )
-            self._sections_panel.add_widget(title_label)
+            self._add_form_child(self._sections_panel, title_label)
             
             # 渲染描述
             if self._form_config.description:
@@ -464,24 +535,115 @@ class ConfigFormView(BaseWidget):
                         "padding": (0, 0, 0, 24)
                     }
                 )
-                self._sections_panel.add_widget(desc_label)
+                self._add_form_child(self._sections_panel, desc_label)
             
-            # 渲染所有分区
+            # 为所有分区创建占位容器，实际内容在进入可视区域时再渲染
             for section in self._form_config.sections:
-                self._render_section(section)
+                self._add_section_placeholder(section)
             
             # 渲染按钮
             self._render_buttons()
             
         except Exception as e:
-            logger.error(f"表单渲染失败: {e}", exc_info=True)
+            logger.error("表单渲染失败: %s", e, exc_info=True)
+        finally:
+            # 所有子组件添加完毕后恢复尺寸传播，只进行一次布局计算
+            self._resume_layout(suspended)
+        
+        # 布局完成后渲染可视区域内的分区
+        self._schedule_visible_sections_render()
     
-    def _render_section(self, section: FormSection) -> None:
-        """渲染表单分区"""
+    def _suspend_layout(self) -> List[ctk.CTkBaseClass]:
+        """
+        暂停分区容器和滚动内容框架随子组件变化调整尺寸（批量增删子组件前调用）
+        
+        Returns:
+            被暂停的组件列表，传给 _resume_layout 恢复
+        """
+        candidates = (
+            self._sections_panel.get_widget() if self._sections_panel else None,
+            self._scroll_panel.get_content_frame() if self._scroll_panel else None,
+        )
+        suspended = [widget for widget in candidates if widget is not None]
+        for widget in suspended:
+            widget.pack_propagate(False)
+        return suspended
+    
+    @staticmethod
+    def _resume_layout(suspended: List[ctk.CTkBaseClass]) -> None:
+        """恢复尺寸调整并一次性完成布局计算"""
+        for widget in suspended:
+            widget.pack_propagate(True)
+        if suspended:
+            suspended[-1].update_idletasks()
+    
+    def _add_section_placeholder(self, section: FormSection) -> None:
+        """创建分区占位容器，按字段数量预留估算高度"""
+        container = Panel(
+            self._sections_panel,
+            widget_id=f"{self.widget_id}_section_{section.id}",
+            style={"orientation": "vertical"}
+        )
+        self._add_form_child(self._sections_panel, container)
+        
+        container_widget = container.get_widget()
+        if container_widget is not None:
+            visible_fields = sum(1 for field in section.fields if field.visible)
+            container_widget.configure(height=_SECTION_HEADER_HEIGHT + visible_fields * _FIELD_ROW_HEIGHT)
+            container_widget.pack_propagate(False)
+        
+        self._pending_sections[section.id] = (section, container)
+    
+    def _schedule_visible_sections_render(self) -> None:
+        """合并同一轮事件循环内的多次检查请求"""
+        if not self._pending_sections or self._visible_check_scheduled:
+            return
+        
+        scroll_widget = self._scroll_panel.get_widget() if self._scroll_panel else None
+        if scroll_widget is None:
+            self._render_visible_sections()
+            return
+        
+        self._visible_check_scheduled = True
+        scroll_widget.after_idle(self._render_visible_sections)
+    
+    def _render_visible_sections(self) -> None:
+        """渲染与可视区域相交的占位分区"""
+        self._visible_check_scheduled = False
+        if not self._pending_sections:
+            return
+        
+        scroll_panel = self._scroll_panel
+        if scroll_panel is None:
+            visible_ids = list(self._pending_sections)
+        else:
+            visible_ids = [
+                section_id for section_id, (_, container) in self._pending_sections.items()
+                if scroll_panel.is_in_viewport(container.get_widget())
+            ]
+        
+        for section_id in visible_ids:
+            section, container = self._pending_sections.pop(section_id)
+            container_widget = container.get_widget()
+            if container_widget is not None:
+                container_widget.pack_propagate(True)
+            self._render_section(section, container)
+    
+    def _pending_field_values(self) -> Dict[str, Any]:
+        """尚未渲染分区中可见字段的当前值"""
+        values = {}
+        for section, _ in self._pending_sections.values():
+            for field in section.fields:
+                if field.visible:
+                    values[field.id] = field.value
+        return values
+    
+    def _render_section(self, section: FormSection, container: Panel) -> None:
+        """渲染表单分区到占位容器中"""
         try:
             # 分区标题
             section_title = Label(
-                self._sections_panel,
+                container,
                 text=section.title,
                 widget_id=f"{self.widget_id}_section_{section.id}_title",
                 style={
@@ -490,12 +652,12 @@ class ConfigFormView(BaseWidget):
                     "padding": (0, 16, 0, 12)
                 }
             )
-            self._sections_panel.add_widget(section_title)
+            container.add_widget(section_title)
             
             # 分区描述
             if section.description:
                 section_desc = Label(
-                    self._sections_panel,
+                    container,
                     text=section.description,
                     widget_id=f"{self.widget_id}_section_{section.id}_desc",
                     style={
@@ -505,18 +667,18 @@ class ConfigFormView(BaseWidget):
                         "padding": (0, 0, 0, 12)
                     }
                 )
-                self._sections_panel.add_widget(section_desc)
+                container.add_widget(section_desc)
             
             # 创建分区内容面板
             section_panel = Panel(
-                self._sections_panel,
+                container,
                 widget_id=f"{self.widget_id}_section_{section.id}_content",
                 style={
                     "orientation": section.layout.value,
                     "padding": (0, 0, 0, 24)
                 }
             )
-            self._sections_panel.add_widget(section_panel)
+            container.add_widget(section_panel)
             
             # 渲染分区内的字段
             for field in section.fields:
@@ -524,7 +686,7 @@ class ConfigFormView(BaseWidget):
                     self._render_field(field, section_panel)
             
         except Exception as e:
-            logger.error(f"分区渲染失败 {section.id}: {e}", exc_info=True)
+            logger.error("分区渲染失败 %s: %s", section.id, e, exc_info=True)
     
     def _render_field(self, field: FormField, parent_panel: Panel) -> None:
         """渲染单个字段"""
@@ -542,11 +704,22 @@ class ConfigFormView(BaseWidget):
             )
             parent_panel.add_widget(field_label)
             
-            # 渲染字段控件
+            # 渲染字段控件（已缓存的组件直接复用，只刷新值和状态）
+            reused = self._field_renderer.is_cached(field.id)
             field_widget = self._field_renderer.render_field(field)
             if field_widget:
+                if reused:
+                    self._field_renderer.refresh_field(field_widget, field)
                 parent_panel.add_widget(field_widget)
-                self._field_widgets[field.id] = (field_widget, field)
+                self._field_widgets[field.id] = _FieldBinding(
+                    widget=field_widget,
+                    field=field,
+                    get_value=getattr(field_widget, 'get_value', None),
+                    set_value=getattr(field_widget, 'set_value', None),
+                    set_state=getattr(field_widget, 'set_state', None)
+                )
+                if not reused:
+                    self._bind_dirty_tracking(field.id, field_widget)
                 
                 # 添加字段描述（如果有）
                 if field.description:
@@ -563,7 +736,20 @@ class ConfigFormView(BaseWidget):
                     parent_panel.add_widget(desc_label)
             
         except Exception as e:
-            logger.error(f"字段渲染失败 {field.id}: {e}", exc_info=True)
+            logger.error("字段渲染失败 %s: %s", field.id, e, exc_info=True)
+    
+    def _bind_dirty_tracking(self, field_id: str, field_widget: BaseWidget) -> None:
+        """绑定用户输入事件，在字段被修改时标记为脏"""
+        def mark_dirty(_event=None) -> None:
+            self._dirty_fields.add(field_id)
+        
+        # 键盘输入覆盖文本类字段，鼠标点击覆盖开关
+        field_widget.bind_event("<KeyRelease>", mark_dirty)
+        field_widget.bind_event("<ButtonRelease-1>", mark_dirty)
+        
+        # 下拉框的bind只作用于内部输入框，从列表选中时不会触发上述事件，需走选项变更回调
+        if isinstance(field_widget, Dropdown):
+            field_widget.set_command(mark_dirty)
     
     def _render_buttons(self) -> None:
         """渲染表单按钮"""
@@ -576,7 +762,7 @@ class ConfigFormView(BaseWidget):
             widget_id=f"{self.widget_id}_spacer",
             style={"fill": "both", "expand": True}
         )
-        self._button_panel.add_widget(spacer)
+        self._add_form_child(self._button_panel, spacer)
         
         # 重置按钮（如果启用）
         if self._form_config and self._form_config.show_reset:
@@ -595,7 +781,7 @@ class ConfigFormView(BaseWidget):
                 },
                 command=self._on_reset_click
             )
-            self._button_panel.add_widget(reset_btn)
+            self._add_form_child(self._button_panel, reset_btn)
         
         # 取消按钮（如果启用）
         if self._form_config and self._form_config.show_cancel:
@@ -614,7 +800,7 @@ class ConfigFormView(BaseWidget):
                 },
                 command=self._on_cancel_click
             )
-            self._button_panel.add_widget(cancel_btn)
+            self._add_form_child(self._button_panel, cancel_btn)
         
         # 提交按钮
         submit_text = self._form_config.submit_text if self._form_config else "保存"
@@ -632,7 +818,7 @@ class ConfigFormView(BaseWidget):
             },
             command=self._on_submit_click
         )
-        self._button_panel.add_widget(submit_btn)
+        self._add_form_child(self._button_panel, submit_btn)
     
     def validate_form(self) -> FormValidationResult:
         """验证整个表单"""
@@ -646,25 +832,44 @@ class ConfigFormView(BaseWidget):
                 values={}
             )
         
-        # 收集所有字段值
-        for field_id, (widget, field) in self._field_widgets.items():
-            # 获取UI组件的值
-            value = self._field_renderer.get_field_value(widget, field.field_type)
-            values[field_id] = value
+        # 收集所有字段值（未修改的字段沿用上次的值和验证结果）
+        dirty_fields = self._dirty_fields
+        for field_id, binding in self._field_widgets.items():
+            if field_id in dirty_fields or field_id not in self._field_values:
+                field = binding.field
+                
+                # 获取UI组件的值
+                value = self._field_renderer.get_field_value(binding.get_value, field.field_type)
+                self._field_values[field_id] = value
+                
+                # 验证字段
+                self._validation_errors.pop(field_id, None)
+                if field.visible and field.enabled:
+                    # 更新字段值（用于验证）
+                    success, error_msg = field.update_value(value)
+                    if not success:
+                        self._validation_errors[field_id] = error_msg
             
-            # 验证字段
-            if field.visible and field.enabled:
-                # 更新字段值（用于验证）
-                success, error_msg = field.update_value(value)
-                if not success:
-                    errors.append(FieldValidationResult(field_id, False, error_msg))
+            values[field_id] = self._field_values[field_id]
+        
+        dirty_fields.clear()
+        
+        # 未渲染分区的字段没有被用户修改过，直接使用字段当前值
+        values.update(self._pending_field_values())
+        
+        errors.extend(
+            FieldValidationResult(field_id, False, error_msg)
+            for field_id, error_msg in self._validation_errors.items()
+        )
         
         # 执行表单级别的验证
         if self._form_config.validation_level != ValidationLevel.NONE:
             form_errors = self._form_config.validate_all()
-            for section_id, section_errors in form_errors.items():
-                for field_id, error_msg in section_errors:
-                    errors.append(FieldValidationResult(field_id, False, error_msg))
+            errors.extend(
+                FieldValidationResult(field_id, False, error_msg)
+                for section_errors in form_errors.values()
+                for field_id, error_msg in section_errors
+            )
         
         return FormValidationResult(
             is_valid=len(errors) == 0,
@@ -676,10 +881,11 @@ class ConfigFormView(BaseWidget):
         """获取表单所有值（不验证）"""
         values = {}
         
-        for field_id, (widget, field) in self._field_widgets.items():
-            value = self._field_renderer.get_field_value(widget, field.field_type)
+        for field_id, binding in self._field_widgets.items():
+            value = self._field_renderer.get_field_value(binding.get_value, binding.field.field_type)
             values[field_id] = value
         
+        values.update(self._pending_field_values())
         return values
     
     def reset_form(self) -> None:
@@ -691,15 +897,17 @@ class ConfigFormView(BaseWidget):
             # 重置表单配置
             self._form_config.reset_to_defaults()
             
-            # 更新UI组件
-            for field_id, (widget, field) in self._field_widgets.items():
-                if hasattr(widget, 'set_value'):
-                    widget.set_value(field.value if field.value is not None else "")
+            # 更新UI组件（所有字段都需要重新验证）
+            self._dirty_fields.update(self._field_widgets)
+            for binding in self._field_widgets.values():
+                if binding.set_value is not None:
+                    field = binding.field
+                    binding.set_value(field.value if field.value is not None else "")
             
-            logger.info(f"表单已重置: {self._form_config.title}")
+            logger.info("表单已重置: %s", self._form_config.title)
             
         except Exception as e:
-            logger.error(f"表单重置失败: {e}", exc_info=True)
+            logger.error("表单重置失败: %s", e, exc_info=True)
     
     def _on_submit_click(self) -> None:
         """提交按钮点击事件"""
@@ -708,7 +916,7 @@ class ConfigFormView(BaseWidget):
             validation_result = self.validate_form()
             
             if validation_result.is_valid:
-                logger.info(f"表单验证通过: {self._form_config.title if self._form_config else 'unknown'}")
+                logger.info("表单验证通过: %s", self._form_config.title if self._form_config else 'unknown')
                 
                 # 调用提交回调
                 if self._on_submit:
@@ -722,22 +930,24 @@ class ConfigFormView(BaseWidget):
                         "valid": True
                     })
             else:
-                logger.warning(f"表单验证失败: {len(validation_result.errors)} 个错误")
+                errors = validation_result.errors
+                logger.warning("表单验证失败: %s 个错误", len(errors))
                 
                 # 显示错误信息（TODO: 实现错误UI显示）
-                for error in validation_result.errors:
-                    logger.warning(f"字段错误: {error.field_id} - {error.message}")
+                if logger.isEnabledFor(logging.WARNING):
+                    for error in errors:
+                        logger.warning("字段错误: %s - %s", error.field_id, error.message)
                 
-                # 发布验证失败事件
+                # 发布验证失败事件（事件会保存在总线历史中，因此每次使用新的载荷字典）
                 if self._event_bus and self._form_config:
                     self._event_bus.publish("form.validation_failed", {
                         "form_id": self._form_config.id,
-                        "error_count": len(validation_result.errors),
-                        "errors": [(e.field_id, e.message or "") for e in validation_result.errors]
+                        "error_count": len(errors),
+                        "errors": [(error.field_id, error.message or "") for error in errors]
                     })
             
         except Exception as e:
-            logger.error(f"表单提交失败: {e}", exc_info=True)
+            logger.error("表单提交失败: %s", e, exc_info=True)
     
     def _on_cancel_click(self) -> None:
         """取消按钮点击事件"""
@@ -763,26 +973,27 @@ class ConfigFormView(BaseWidget):
         if field_id not in self._field_widgets:
             return False
         
-        widget, field = self._field_widgets[field_id]
+        binding = self._field_widgets[field_id]
         
         try:
-            if hasattr(widget, 'set_value'):
-                widget.set_value(value)
+            if binding.set_value is not None:
+                binding.set_value(value)
+                self._dirty_fields.add(field_id)
                 
                 # 更新字段对象的值
-                success, error = field.update_value(value)
+                success, error = binding.field.update_value(value)
                 return success
             else:
                 return False
                 
         except Exception as e:
-            logger.error(f"更新字段值失败 {field_id}: {e}", exc_info=True)
+            logger.error("更新字段值失败 %s: %s", field_id, e)
             return False
     
     def show_field(self, field_id: str, show: bool = True) -> bool:
         """显示或隐藏字段"""
         # TODO: 实现字段显示/隐藏逻辑
-        logger.warning(f"字段显示/隐藏功能暂未实现: {field_id}")
+        logger.warning("字段显示/隐藏功能暂未实现: %s", field_id)
         return False
     
     def enable_field(self, field_id: str, enable: bool = True) -> bool:
@@ -790,16 +1001,19 @@ class ConfigFormView(BaseWidget):
         if field_id not in self._field_widgets:
             return False
         
-        widget, field = self._field_widgets[field_id]
+        binding = self._field_widgets[field_id]
         
         try:
             state = "normal" if enable else "disabled"
-            widget.set_state(state)
-            field.enabled = enable
+            binding.set_state(state)
+            binding.field.enabled = enable
+            
+            # 启用状态影响是否参与验证
+            self._dirty_fields.add(field_id)
             return True
             
         except Exception as e:
-            logger.error(f"设置字段启用状态失败 {field_id}: {e}", exc_info=True)
+            logger.error("设置字段启用状态失败 %s: %s", field_id, e)
             return False
     
     def get_form_config(self) -> Optional[FormConfig]:
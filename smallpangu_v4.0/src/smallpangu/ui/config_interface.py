@@ -11,14 +11,26 @@
 
 import customtkinter as ctk
 import logging
+import sys
+from tkinter import ttk
 import json
-import yaml
-from typing import Dict, Any, Optional, List, Callable, Union, Tuple, Literal
+from typing import Dict, Any, Optional, List, Set, Callable, Union, Tuple, Literal
 from dataclasses import dataclass, field
+from collections import defaultdict
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 import copy
 
+from pydantic import BaseModel
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 from ..core.events import EventBus
 from ..core.di import Container
 from ..config.manager import ConfigManager
@@ -28,13 +40,23 @@ from ..config.models import (
     LogLevel, Theme, Language, StorageType, SwitchStrategy, ConfirmLevel, OperationType
 )
 from .manager import UIManager
-from .widgets import BaseWidget, Panel, ScrollPanel, Card, Button, Label, Switch, TextArea, InputField
+from .widgets import BaseWidget, Panel, ScrollPanel, Card, Button, Label, Switch, TextArea, InputField, _DATACLASS_SLOTS
 from ..core.errors import UIError
 from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _dumps_pretty(value: Any) -> str:
+    """将列表/字典序列化为缩进JSON（优先使用orjson，不支持的值回退到标准库）"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, indent=2)
+
+
 class ConfigViewType(str, Enum):
     """配置视图类型枚举"""
     TREE = "tree"          # 树形视图
@@ -58,7 +80,201 @@ class ConfigSection(str, Enum):
     ENVIRONMENT = "environment"
 
 
-@dataclass
+# 输入验证防抖延迟（毫秒）
+_VALIDATE_DEBOUNCE_MS = 150
+
+# 需要刷新配置界面的事件类型
+_CONFIG_REFRESH_EVENTS = ("config.updated", "config.reloaded", "environment.changed")
+
+# 配置变更事件触发界面刷新的合并延迟（毫秒）
+_REFRESH_DEBOUNCE_MS = 50
+
+# 未渲染配置卡片占位框架的估算高度（像素）
+_CARD_PLACEHOLDER_HEIGHT = 120
+
+# 每轮空闲回调最多创建的配置卡片数量
+_CARD_RENDER_BATCH_SIZE = 10
+
+# 配置卡片样式（已修改 / 未修改）
+_CARD_COLORS_MODIFIED: Dict[str, Any] = {
+    "fg_color": ("#fff3e0", "#332d1c"),
+    "border_color": ("#ff9800", "#8a5b00")
+}
+_CARD_COLORS_NORMAL: Dict[str, Any] = {
+    "fg_color": ("white", "gray20"),
+    "border_color": ("gray70", "gray40")
+}
+_CARD_STYLE_MODIFIED: Dict[str, Any] = {**_CARD_COLORS_MODIFIED, "border_width": 2}
+_CARD_STYLE_NORMAL: Dict[str, Any] = {**_CARD_COLORS_NORMAL, "border_width": 1}
+
+# 分区显示名称
+_SECTION_DISPLAY_NAMES: Dict[ConfigSection, str] = {
+    ConfigSection.APP: "应用设置",
+    ConfigSection.PLUGINS: "插件设置",
+    ConfigSection.EVENT_BUS: "事件总线",
+    ConfigSection.LOGGING: "日志设置",
+    ConfigSection.AI: "AI设置",
+    ConfigSection.SECURITY: "安全设置",
+    ConfigSection.UI: "界面设置",
+    ConfigSection.STORAGE: "存储设置",
+    ConfigSection.METRICS: "指标设置",
+    ConfigSection.TESTING: "测试设置",
+    ConfigSection.ENVIRONMENT: "环境变量"
+}
+
+
+# 字段注解 -> 数据类型
+_ANNOTATION_DATA_TYPES: Dict[Any, str] = {
+    int: "int",
+    float: "float",
+    bool: "bool",
+    str: "str",
+}
+
+
+# 界面字体
+_FONT_FAMILY = "Microsoft YaHei"
+
+
+@lru_cache(maxsize=None)
+def _shared_font(size: int, weight: Literal["normal", "bold"] = "normal") -> ctk.CTkFont:
+    """
+    获取共享字体对象
+    
+    CTkFont需要在根窗口创建后才能实例化，因此在首次使用时创建并缓存，
+    所有配置卡片共用同一组字体对象。
+    """
+    return ctk.CTkFont(family=_FONT_FAMILY, size=size, weight=weight)
+
+
+@lru_cache(maxsize=None)
+def _enum_value_tuple(enum_class: type) -> Tuple[Any, ...]:
+    """按枚举类缓存全部枚举值"""
+    return tuple(e.value for e in enum_class)
+
+
+# 布尔值可接受的字符串形式
+_BOOL_LITERALS = frozenset(("true", "false", "1", "0", "yes", "no"))
+_BOOL_ERROR = "必须是布尔值 (true/false)"
+
+
+@dataclass(frozen=True)
+class _FieldSpec:
+    """配置模型字段的静态信息"""
+    name: str
+    data_type: Optional[str]  # 无法仅凭注解确定时为None，由字段值判断
+    description: str
+    default: Any
+    extra_constraints: Dict[str, Any]
+
+
+@lru_cache(maxsize=None)
+def _model_field_specs(model_class: type) -> Tuple[_FieldSpec, ...]:
+    """
+    按配置模型类缓存字段信息
+    
+    配置模型结构是静态的，注解分类、描述、默认值和额外约束每个类只需提取一次，
+    解析时只需读取字段值。
+    """
+    specs = []
+    for field_name, field_info in model_class.model_fields.items():
+        annotation = field_info.annotation
+        data_type = _ANNOTATION_DATA_TYPES.get(annotation)
+        if data_type is None and getattr(annotation, "__origin__", None) == Literal:
+            data_type = "enum"
+        specs.append(_FieldSpec(
+            name=field_name,
+            data_type=data_type,
+            description=field_info.description or "",
+            default=field_info.default,
+            extra_constraints=dict(field_info.json_schema_extra or {})
+        ))
+    return tuple(specs)
+
+
+# 不可变的配置值类型，复制时直接复用
+_IMMUTABLE_TYPES = (int, float, str, bool, bytes, type(None), Enum)
+
+
+def _copy_value(value: Any) -> Any:
+    """
+    复制配置值
+    
+    不可变值直接返回；元素均不可变的列表/字典做浅复制；其他情况深复制。
+    """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, list) and all(isinstance(v, _IMMUTABLE_TYPES) for v in value):
+        return list(value)
+    if isinstance(value, dict) and all(isinstance(v, _IMMUTABLE_TYPES) for v in value.values()):
+        return dict(value)
+    return copy.deepcopy(value)
+
+
+def _differs_from_original(value: Any, original: Any) -> bool:
+    """
+    判断值是否与原始值不同
+    
+    同一对象直接视为未修改；原始值为列表/字典而新值类型不同（如输入框中的字符串）时
+    直接视为已修改，避免逐层比较结构。
+    """
+    if value is original:
+        return False
+    if isinstance(original, (dict, list)) and type(value) is not type(original):
+        return True
+    return value != original
+
+
+def _check_range(item: "ConfigItem", converted: Union[int, float]) -> Tuple[bool, Optional[str]]:
+    """数值范围验证"""
+    if "ge" in item.constraints and converted < item.constraints["ge"]:
+        return False, item._constraint_errors["ge"]
+    if "le" in item.constraints and converted > item.constraints["le"]:
+        return False, item._constraint_errors["le"]
+    return True, None
+
+
+def _validate_int(item: "ConfigItem", new_value: Any) -> Tuple[bool, Optional[str]]:
+    """整数验证"""
+    return _check_range(item, int(new_value))
+
+
+def _validate_float(item: "ConfigItem", new_value: Any) -> Tuple[bool, Optional[str]]:
+    """浮点数验证"""
+    return _check_range(item, float(new_value))
+
+
+def _validate_bool(item: "ConfigItem", new_value: Any) -> Tuple[bool, Optional[str]]:
+    """布尔值验证"""
+    if isinstance(new_value, bool):
+        return True, None
+    if isinstance(new_value, str) and new_value.lower() in _BOOL_LITERALS:
+        return True, None
+    return False, _BOOL_ERROR
+
+
+def _validate_enum(item: "ConfigItem", new_value: Any) -> Tuple[bool, Optional[str]]:
+    """枚举值验证"""
+    enum_class = item.constraints.get("enum_class")
+    if enum_class is not None and isinstance(new_value, enum_class):
+        return True, None
+    if new_value in item._enum_values:
+        return True, None
+    return False, item._constraint_errors["enum"]
+
+
+def _validate_str(item: "ConfigItem", new_value: Any) -> Tuple[bool, Optional[str]]:
+    """字符串验证"""
+    if not item.constraints:
+        return True, None
+    if "min_length" in item.constraints and len(new_value) < item.constraints["min_length"]:
+        return False, item._constraint_errors["min_length"]
+    if "max_length" in item.constraints and len(new_value) > item.constraints["max_length"]:
+        return False, item._constraint_errors["max_length"]
+    return True, None
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ConfigItem:
     """配置项数据类"""
     section: ConfigSection
@@ -71,65 +287,81 @@ class ConfigItem:
     is_modified: bool = False
     original_value: Optional[Any] = None
     
+    # 分区值和完整键（"分区.键"），初始化时生成
+    section_value: str = field(default="", init=False, repr=False, compare=False)
+    item_id: str = field(default="", init=False, repr=False, compare=False)
+    
+    # 显示值缓存（以值对象本身为键，值被替换后自动失效）
+    _display_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _display_source: Any = field(default=None, init=False, repr=False, compare=False)
+    
+    # 约束错误消息和枚举取值（约束在初始化后不再变化，预先生成）
+    _constraint_errors: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _enum_values: Tuple[Any, ...] = field(default=(), init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.section_value = self.section.value
+        # 驻留字符串：作为字典键反复查找时可直接按对象身份命中
+        self.item_id = sys.intern(f"{self.section_value}.{self.key}")
+        
+        constraints = self.constraints
+        errors = self._constraint_errors
+        if "ge" in constraints:
+            errors["ge"] = f"值必须 >= {constraints['ge']}"
+        if "le" in constraints:
+            errors["le"] = f"值必须 <= {constraints['le']}"
+        if "min_length" in constraints:
+            errors["min_length"] = f"长度必须 >= {constraints['min_length']}"
+        if "max_length" in constraints:
+            errors["max_length"] = f"长度必须 <= {constraints['max_length']}"
+        
+        enum_class = constraints.get("enum_class")
+        self._enum_values = _enum_value_tuple(enum_class) if enum_class else ()
+        errors["enum"] = f"必须是有效的枚举值: {list(self._enum_values)}"
+    
     def get_display_value(self) -> str:
         """获取显示值"""
-        if self.value is None:
-            return "null"
-        elif isinstance(self.value, (list, dict)):
-            return json.dumps(self.value, ensure_ascii=False, indent=2)
+        value = self.value
+        if self._display_cache is not None and value is self._display_source:
+            return self._display_cache
+        
+        if value is None:
+            display = "null"
+        elif isinstance(value, (list, dict)):
+            display = _dumps_pretty(value)
         else:
-            return str(self.value)
+            display = str(value)
+        
+        self._display_cache = display
+        self._display_source = value
+        return display
     
     def validate(self, new_value: Any) -> Tuple[bool, Optional[str]]:
         """验证新值"""
+        validator = self._VALIDATORS.get(self.data_type)
+        if validator is None:
+            return True, None
+        
         try:
-            # 类型转换
-            if self.data_type == "int":
-                converted = int(new_value)
-                if "ge" in self.constraints and converted < self.constraints["ge"]:
-                    return False, f"值必须 >= {self.constraints['ge']}"
-                if "le" in self.constraints and converted > self.constraints["le"]:
-                    return False, f"值必须 <= {self.constraints['le']}"
-                return True, None
-            elif self.data_type == "float":
-                converted = float(new_value)
-                if "ge" in self.constraints and converted < self.constraints["ge"]:
-                    return False, f"值必须 >= {self.constraints['ge']}"
-                if "le" in self.constraints and converted > self.constraints["le"]:
-                    return False, f"值必须 <= {self.constraints['le']}"
-                return True, None
-            elif self.data_type == "bool":
-                if isinstance(new_value, bool):
-                    return True, None
-                if isinstance(new_value, str):
-                    lower = new_value.lower()
-                    if lower in ["true", "false", "1", "0", "yes", "no"]:
-                        return True, None
-                return False, "必须是布尔值 (true/false)"
-            elif self.data_type == "enum":
-                # 枚举值验证
-                if new_value in [e.value for e in self.constraints.get("enum_class", [])]:
-                    return True, None
-                return False, f"必须是有效的枚举值: {[e.value for e in self.constraints.get('enum_class', [])]}"
-            elif self.data_type == "str":
-                if not self.constraints:
-                    return True, None
-                if "min_length" in self.constraints and len(new_value) < self.constraints["min_length"]:
-                    return False, f"长度必须 >= {self.constraints['min_length']}"
-                if "max_length" in self.constraints and len(new_value) > self.constraints["max_length"]:
-                    return False, f"长度必须 <= {self.constraints['max_length']}"
-                return True, None
-            else:
-                return True, None
+            return validator(self, new_value)
         except (ValueError, TypeError) as e:
             return False, f"类型转换失败: {e}"
     
+    # 数据类型 -> 验证函数（未列出的类型不做验证）
+    _VALIDATORS = {
+        "int": _validate_int,
+        "float": _validate_float,
+        "bool": _validate_bool,
+        "enum": _validate_enum,
+        "str": _validate_str,
+    }
+    
     def update_value(self, new_value: Any) -> bool:
         """更新值并返回是否成功"""
         is_valid, error = self.validate(new_value)
         if is_valid:
             self.value = new_value
-            self.is_modified = self.value != self.original_value
+            self.is_modified = _differs_from_original(new_value, self.original_value)
             return True
         return False
 
@@ -144,6 +376,7 @@ class ConfigCard(BaseWidget):
         widget_id: Optional[str] = None,
         on_save: Optional[Callable] = None,
         on_reset: Optional[Callable] = None,
+        on_change: Optional[Callable] = None,
         **kwargs
     ):
         """
@@ -155,12 +388,14 @@ class ConfigCard(BaseWidget):
             widget_id: 组件ID
             on_save: 保存回调
             on_reset: 重置回调
+            on_change: 值被编辑后的回调
             **kwargs: 其他参数
         """
         super().__init__(parent, widget_id, None)
         self._config_item = config_item
         self._on_save = on_save
         self._on_reset = on_reset
+        self._on_change = on_change
         self._kwargs = kwargs
         
         # UI组件
@@ -170,30 +405,33 @@ class ConfigCard(BaseWidget):
         self._save_button = None
         self._reset_button = None
         self._error_label = None
+        self._error_parent = None
+        
+        # 最近一次显示的错误状态（是否显示, 消息）
+        self._last_error_state: Tuple[bool, str] = (False, "")
+        
+        # 输入验证防抖的after任务ID、调度控件及待执行的验证函数
+        self._pending_validate_id: Optional[str] = None
+        self._pending_validate_widget = None
+        self._pending_validate: Optional[Callable[[], None]] = None
+        
+        # 最近一次应用到卡片的修改状态（未变化时跳过样式更新）
+        self._last_modified_style: Optional[bool] = None
         
         self.initialize()
         
-        logger.debug_struct("配置卡片初始化", section=config_item.section.value, key=config_item.key)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug_struct("配置卡片初始化", section=config_item.section_value, key=config_item.key)
     
     def create_widget(self) -> ctk.CTkBaseClass:
         """创建配置卡片组件"""
         # 根据是否修改确定卡片样式
-        if self._config_item.is_modified:
-            card_style = {
-                "fg_color": ("#fff3e0", "#332d1c"),
-                "border_color": ("#ff9800", "#8a5b00"),
-                "border_width": 2
-            }
-        else:
-            card_style = {
-                "fg_color": ("white", "gray20"),
-                "border_color": ("gray70", "gray40"),
-                "border_width": 1
-            }
+        card_style = _CARD_STYLE_MODIFIED if self._config_item.is_modified else _CARD_STYLE_NORMAL
         
         # 创建卡片
         self._card = Card(self._parent, style=card_style)
         card_widget = self._card.get_widget()
+        self._last_modified_style = self._config_item.is_modified
         
         # 配置卡片网格
         card_widget.grid_columnconfigure(0, weight=1)  # 内容区域
@@ -229,7 +467,7 @@ class ConfigCard(BaseWidget):
         self._title_label = ctk.CTkLabel(
             title_frame,
             text=self._config_item.key,
-            font=("Microsoft YaHei", 12, "bold"),
+            font=_shared_font(12, "bold"),
             anchor="w"
         )
         self._title_label.pack(side="left", fill="x", expand=True)
@@ -238,7 +476,7 @@ class ConfigCard(BaseWidget):
         type_label = ctk.CTkLabel(
             title_frame,
             text=f"({self._config_item.data_type})",
-            font=("Microsoft YaHei", 10),
+            font=_shared_font(10),
             text_color=("gray50", "gray60")
         )
         type_label.pack(side="right", padx=(10, 0))
@@ -252,7 +490,7 @@ class ConfigCard(BaseWidget):
             desc_label = ctk.CTkLabel(
                 parent,
                 text=self._config_item.description,
-                font=("Microsoft YaHei", 10),
+                font=_shared_font(10),
                 wraplength=400,
                 justify="left",
                 anchor="w",
@@ -277,7 +515,7 @@ class ConfigCard(BaseWidget):
             switch_label = ctk.CTkLabel(
                 switch_frame,
                 text="值:",
-                font=("Microsoft YaHei", 11)
+                font=_shared_font(11)
             )
             switch_label.pack(side="left", padx=(0, 10))
             
@@ -297,7 +535,7 @@ class ConfigCard(BaseWidget):
                 new_value = bool_switch.get_value()
                 self._config_item.update_value(new_value)
                 bool_switch.configure(text="启用" if new_value else "禁用")
-                self._update_card_style()
+                self._on_value_edited()
             
             switch_widget.configure(command=on_switch_toggled)
             
@@ -311,16 +549,16 @@ class ConfigCard(BaseWidget):
             enum_label = ctk.CTkLabel(
                 enum_frame,
                 text="值:",
-                font=("Microsoft YaHei", 11)
+                font=_shared_font(11)
             )
             enum_label.pack(side="left", padx=(0, 10))
             
             # 获取枚举值
             enum_class = self._config_item.constraints.get("enum_class")
             if enum_class:
-                enum_values = [e.value for e in enum_class]
+                enum_values = _enum_value_tuple(enum_class)
             else:
-                enum_values = [str(self._config_item.value)]
+                enum_values = (str(self._config_item.value),)
             
             enum_combo = ctk.CTkComboBox(
                 enum_frame,
@@ -341,27 +579,25 @@ class ConfigCard(BaseWidget):
             entry_label = ctk.CTkLabel(
                 entry_frame,
                 text="值:",
-                font=("Microsoft YaHei", 11)
+                font=_shared_font(11)
             )
             entry_label.pack(side="left", padx=(0, 10))
             
             # 多行文本用于复杂值
-            if isinstance(self._config_item.value, (dict, list)) or len(value_str) > 50:
+            is_complex = isinstance(self._config_item.value, (dict, list))
+            if is_complex or len(value_str) > 50:
                 self._value_entry = TextArea(
                     entry_frame,
                     widget_id=f"{self._widget_id}_text",
-                    height=100 if isinstance(self._config_item.value, (dict, list)) else 60
+                    height=100 if is_complex else 60
                 )
                 entry_widget = self._value_entry.get_widget()
                 entry_widget.pack(side="left", fill="x", expand=True)
                 entry_widget.insert("1.0", value_str)
                 
-                # 绑定文本变更事件
+                # 绑定文本变更事件（防抖，连续输入只验证一次）
                 def on_text_changed(*args):
-                    new_value = entry_widget.get("1.0", "end-1c")
-                    success = self._config_item.update_value(new_value)
-                    self._update_card_style()
-                    self._show_error(not success, "值格式错误" if not success else "")
+                    self._schedule_validation(entry_widget, lambda: entry_widget.get("1.0", "end-1c"))
                 
                 entry_widget.bind("<KeyRelease>", on_text_changed)
                 
@@ -377,12 +613,9 @@ class ConfigCard(BaseWidget):
                 entry_widget.pack(side="left", fill="x", expand=True)
                 entry_widget.insert(0, value_str)
                 
-                # 绑定文本变更事件
+                # 绑定文本变更事件（防抖，连续输入只验证一次）
                 def on_entry_changed(*args):
-                    new_value = entry_widget.get()
-                    success = self._config_item.update_value(new_value)
-                    self._update_card_style()
-                    self._show_error(not success, "值格式错误" if not success else "")
+                    self._schedule_validation(entry_widget, entry_widget.get)
                 
                 entry_widget.bind("<KeyRelease>", on_entry_changed)
         
@@ -393,7 +626,7 @@ class ConfigCard(BaseWidget):
         default_label = ctk.CTkLabel(
             default_frame,
             text=f"默认值: {self._config_item.default_value}",
-            font=("Microsoft YaHei", 9),
+            font=_shared_font(9),
             text_color=("gray50", "gray60")
         )
         default_label.pack(side="left")
@@ -406,29 +639,72 @@ class ConfigCard(BaseWidget):
                 constraints_label = ctk.CTkLabel(
                     default_frame,
                     text=f"约束: {constraints_text}",
-                    font=("Microsoft YaHei", 9),
+                    font=_shared_font(9),
                     text_color=("gray50", "gray60")
                 )
                 constraints_label.pack(side="right")
                 self.register_widget("constraints_label", constraints_label)
         
-        # 错误标签（初始隐藏）
-        self._error_label = ctk.CTkLabel(
-            parent,
-            text="",
-            font=("Microsoft YaHei", 10),
-            text_color=("red", "#ff6666")
-        )
-        self._error_label.pack(fill="x", padx=0, pady=(5, 0))
-        self._error_label.pack_forget()
+        # 错误标签在首次出错时才创建
+        self._error_parent = parent
         
         self.register_widget("edit_frame", edit_frame)
         self.register_widget("default_label", default_label)
     
+    def _schedule_validation(self, entry_widget, read_value: Callable[[], Any]) -> None:
+        """
+        延迟验证输入值，取消尚未执行的上一次验证
+        
+        Args:
+            entry_widget: 输入控件（用于after调度）
+            read_value: 读取当前输入值的函数
+        """
+        if self._pending_validate_id is not None:
+            entry_widget.after_cancel(self._pending_validate_id)
+        
+        def do_validate():
+            self._pending_validate_id = None
+            self._pending_validate_widget = None
+            self._pending_validate = None
+            success = self._config_item.update_value(read_value())
+            self._on_value_edited()
+            self._show_error(not success, "值格式错误" if not success else "")
+        
+        self._pending_validate = do_validate
+        self._pending_validate_widget = entry_widget
+        self._pending_validate_id = entry_widget.after(_VALIDATE_DEBOUNCE_MS, do_validate)
+    
+    def flush_pending_validation(self) -> None:
+        """立即执行尚未触发的延迟验证，保证保存/重置前读取到最新输入"""
+        pending = self._pending_validate
+        if pending is None:
+            return
+        
+        self._pending_validate_widget.after_cancel(self._pending_validate_id)
+        pending()
+    
+    def _on_save_clicked(self) -> None:
+        """处理保存按钮点击"""
+        self.flush_pending_validation()
+        if self._on_save:
+            self._on_save(self._config_item)
+    
+    def _on_reset_clicked(self) -> None:
+        """处理重置按钮点击"""
+        self.flush_pending_validation()
+        if self._on_reset:
+            self._on_reset(self._config_item)
+    
     def _on_enum_changed(self, choice: str) -> None:
         """处理枚举值变化"""
         self._config_item.update_value(choice)
+        self._on_value_edited()
+    
+    def _on_value_edited(self) -> None:
+        """值被编辑后更新样式并通知外部"""
         self._update_card_style()
+        if self._on_change:
+            self._on_change(self._config_item)
     
     def _create_control_buttons(self, parent) -> None:
         """创建控制按钮"""
@@ -446,7 +722,7 @@ class ConfigCard(BaseWidget):
         
         # 绑定点击事件
         save_widget.configure(
-            command=lambda: self._on_save(self._config_item) if self._on_save else None
+            command=self._on_save_clicked
         )
         
         # 重置按钮（仅当值被修改时启用）
@@ -465,7 +741,7 @@ class ConfigCard(BaseWidget):
         
         # 绑定点击事件
         reset_widget.configure(
-            command=lambda: self._on_reset(self._config_item) if self._on_reset else None
+            command=self._on_reset_clicked
         )
         
         # 注册组件
@@ -477,13 +753,15 @@ class ConfigCard(BaseWidget):
         if not self._card or not self._card.get_widget():
             return
         
+        is_modified = self._config_item.is_modified
+        if self._last_modified_style == is_modified:
+            return
+        self._last_modified_style = is_modified
+        
         card_widget = self._card.get_widget()
         
-        if self._config_item.is_modified:
-            card_widget.configure(
-                fg_color=("#fff3e0", "#332d1c"),
-                border_color=("#ff9800", "#8a5b00")
-            )
+        if is_modified:
+            card_widget.configure(**_CARD_COLORS_MODIFIED)
             
             # 启用保存和重置按钮
             if self._save_button:
@@ -491,10 +769,7 @@ class ConfigCard(BaseWidget):
             if self._reset_button:
                 self._reset_button.get_widget().configure(state="normal")
         else:
-            card_widget.configure(
-                fg_color=("white", "gray20"),
-                border_color=("gray70", "gray40")
-            )
+            card_widget.configure(**_CARD_COLORS_NORMAL)
             
             # 禁用保存和重置按钮
             if self._save_button:
@@ -504,14 +779,32 @@ class ConfigCard(BaseWidget):
     
     def _show_error(self, show: bool, message: str = "") -> None:
         """显示或隐藏错误消息"""
-        if not self._error_label:
+        visible = bool(show and message)
+        error_state = (visible, message if visible else "")
+        if error_state == self._last_error_state:
             return
         
-        if show and message:
-            self._error_label.configure(text=message)
+        if visible:
+            if self._error_label is None:
+                if self._error_parent is None:
+                    return
+                self._error_label = ctk.CTkLabel(
+                    self._error_parent,
+                    text=message,
+                    font=_shared_font(10),
+                    text_color=("red", "#ff6666")
+                )
+            else:
+                self._error_label.configure(text=message)
             self._error_label.pack(fill="x", padx=0, pady=(5, 0))
-        else:
+        elif self._error_label is not None:
             self._error_label.pack_forget()
+        
+        self._last_error_state = error_state
+    
+    def get_config_item(self) -> ConfigItem:
+        """获取卡片当前绑定的配置项"""
+        return self._config_item
     
     def update_config_item(self, config_item: ConfigItem) -> None:
         """
@@ -525,9 +818,44 @@ class ConfigCard(BaseWidget):
         # 更新卡片样式
         self._update_card_style()
         
+        # 同步编辑控件显示的值
+        self._refresh_value_display()
+        
         # TODO: 更新其他UI元素
         
-        logger.debug_struct("配置卡片更新", section=config_item.section.value, key=config_item.key)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug_struct("配置卡片更新", section=config_item.section_value, key=config_item.key)
+    
+    def _refresh_value_display(self) -> None:
+        """将编辑控件同步为当前配置项的值（显示内容未变化时不做修改）"""
+        value = self._config_item.value
+        data_type = self._config_item.data_type
+        
+        if data_type == "bool":
+            bool_switch = self.get_registered_widget("bool_switch")
+            if bool_switch is not None and bool(bool_switch.get()) != bool(value):
+                if value:
+                    bool_switch.select()
+                else:
+                    bool_switch.deselect()
+                bool_switch.configure(text="启用" if value else "禁用")
+        elif data_type == "enum":
+            enum_combo = self.get_registered_widget("enum_combo")
+            if enum_combo is not None and enum_combo.get() != str(value):
+                enum_combo.set(str(value))
+        elif self._value_entry is not None:
+            value_str = self._config_item.get_display_value()
+            if self._value_entry.get_value() != value_str:
+                self._value_entry.set_value(value_str)
+    
+    def destroy(self) -> None:
+        """销毁组件（取消尚未执行的延迟验证）"""
+        if self._pending_validate_id is not None:
+            self._pending_validate_widget.after_cancel(self._pending_validate_id)
+            self._pending_validate_id = None
+            self._pending_validate_widget = None
+            self._pending_validate = None
+        super().destroy()
 
 
 class ConfigInterface(BaseWidget):
@@ -572,12 +900,29 @@ class ConfigInterface(BaseWidget):
         self._config_items: Dict[str, ConfigItem] = {}
         self._config_cards: Dict[str, ConfigCard] = {}
         
+        # 分区索引和已修改配置项ID（与_config_items同步维护）
+        self._items_by_section: Dict[ConfigSection, Dict[str, ConfigItem]] = defaultdict(dict)
+        self._modified_item_ids: Set[str] = set()
+        
+        # 延迟渲染: item_id -> (配置项, 占位框架)，进入可视区域后才创建卡片
+        self._pending_cards: Dict[str, Tuple[ConfigItem, ctk.CTkFrame]] = {}
+        self._visible_check_scheduled = False
+        
+        # 当前显示的分区（其他分区已创建的卡片隐藏保留，切换回来时复用）
+        self._shown_section: Optional[ConfigSection] = None
+        
         # UI组件
         self._main_panel = None
         self._sidebar_panel = None
         self._content_panel = None
         self._action_panel = None
         
+        # 树形视图（首次切换到树形视图时创建）
+        self._tree_frame = None
+        self._tree_view: Optional[ttk.Treeview] = None
+        self._tree_detail_frame = None
+        self._tree_detail_card: Optional[ConfigCard] = None
+        
         # 初始化
         self.initialize()
         
@@ -637,7 +982,7 @@ class ConfigInterface(BaseWidget):
         title_label = ctk.CTkLabel(
             action_widget,
             text="配置管理",
-            font=("Microsoft YaHei", 16, "bold"),
+            font=_shared_font(16, "bold"),
             anchor="w"
         )
         title_label.grid(row=0, column=0, sticky="w", padx=20, pady=0)
@@ -649,7 +994,7 @@ class ConfigInterface(BaseWidget):
         view_label = ctk.CTkLabel(
             view_frame,
             text="视图:",
-            font=("Microsoft YaHei", 11)
+            font=_shared_font(11)
         )
         view_label.pack(side="left", padx=(0, 5))
         
@@ -708,9 +1053,118 @@ class ConfigInterface(BaseWidget):
         try:
             self._view_type = ConfigViewType(choice)
             logger.debug_struct("视图类型变更", view_type=self._view_type.value)
-            # TODO: 实现视图切换
         except ValueError:
             logger.warning_struct("无效的视图类型", choice=choice)
+            return
+        
+        # 树形视图使用单个Treeview展示全部配置项，其他视图使用配置卡片
+        # TODO: 实现JSON和比较视图
+        content_widget = self._content_panel.get_widget() if self._content_panel else None
+        if self._view_type == ConfigViewType.TREE:
+            if self._tree_frame is None:
+                self._create_tree_view(self._main_panel.get_widget())
+            else:
+                self._populate_tree_view()
+            if content_widget:
+                content_widget.grid_remove()
+            self._tree_frame.grid()
+        else:
+            if self._tree_frame is not None:
+                self._tree_frame.grid_remove()
+            if content_widget:
+                content_widget.grid()
+    
+    def _create_tree_view(self, parent) -> None:
+        """创建树形视图（Treeview + 选中项详情区域）"""
+        self._tree_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        self._tree_frame.grid(row=1, column=1, sticky="nsew", padx=0, pady=0)
+        self._tree_frame.grid_rowconfigure(0, weight=1)
+        self._tree_frame.grid_columnconfigure(0, weight=1)
+        
+        tree = ttk.Treeview(self._tree_frame, columns=("value", "type", "default"), show="tree headings")
+        tree.heading("#0", text="配置项")
+        tree.heading("value", text="当前值")
+        tree.heading("type", text="类型")
+        tree.heading("default", text="默认值")
+        tree.column("#0", width=220)
+        tree.column("value", width=260)
+        tree.column("type", width=70, stretch=False)
+        tree.column("default", width=160)
+        tree.grid(row=0, column=0, sticky="nsew")
+        
+        scrollbar = ttk.Scrollbar(self._tree_frame, orient="vertical", command=tree.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        tree.configure(yscrollcommand=scrollbar.set)
+        
+        # 选中项的编辑卡片显示在下方
+        self._tree_detail_frame = ctk.CTkFrame(self._tree_frame, fg_color="transparent")
+        self._tree_detail_frame.grid(row=1, column=0, columnspan=2, sticky="ew")
+        
+        tree.bind("<<TreeviewSelect>>", self._on_tree_item_selected)
+        self._tree_view = tree
+        self._populate_tree_view()
+        
+        self.register_widget("tree_view", tree)
+    
+    @staticmethod
+    def _tree_row_values(config_item: ConfigItem) -> Tuple[str, str, str]:
+        """树形视图行数据（多行显示值压缩为单行）"""
+        return (
+            " ".join(config_item.get_display_value().split()),
+            config_item.data_type,
+            str(config_item.default_value)
+        )
+    
+    def _populate_tree_view(self) -> None:
+        """用当前配置项填充树形视图"""
+        tree = self._tree_view
+        if tree is None:
+            return
+        
+        tree.delete(*tree.get_children())
+        for section in ConfigSection:
+            section_items = self._items_by_section.get(section)
+            if not section_items:
+                continue
+            
+            tree.insert("", "end", iid=section.value, text=_SECTION_DISPLAY_NAMES.get(section, section.value))
+            for item_id, config_item in section_items.items():
+                tree.insert(
+                    section.value, "end",
+                    iid=item_id,
+                    text=config_item.key,
+                    values=self._tree_row_values(config_item)
+                )
+    
+    def _refresh_tree_item(self, item_id: str) -> None:
+        """刷新树形视图中的单行"""
+        if self._tree_view is not None and self._tree_view.exists(item_id):
+            self._tree_view.item(item_id, values=self._tree_row_values(self._config_items[item_id]))
+    
+    def _on_tree_item_selected(self, event=None) -> None:
+        """在详情区域显示选中配置项的编辑卡片"""
+        selection = self._tree_view.selection()
+        if not selection or selection[0] not in self._config_items:
+            return
+        
+        config_item = self._config_items[selection[0]]
+        if self._tree_detail_card is not None:
+            # 重新选中同一配置项（如刷新后恢复选中）时保留现有卡片
+            if self._tree_detail_card.get_config_item() is config_item:
+                return
+            self._tree_detail_card.destroy()
+        
+        self._tree_detail_card = ConfigCard(
+            self._tree_detail_frame,
+            config_item=config_item,
+            widget_id=f"config_tree_card_{config_item.section_value}_{config_item.key}",
+            on_save=self._on_config_save,
+            on_reset=self._on_config_reset,
+            on_change=self._on_config_changed
+        )
+        card_widget = self._tree_detail_card.get_widget()
+        if card_widget:
+            card_widget.pack(fill="x", padx=10, pady=5)
     
     def _create_sidebar_panel(self, parent) -> None:
         """创建侧边栏面板"""
@@ -744,22 +1198,7 @@ class ConfigInterface(BaseWidget):
     
     def _create_section_button(self, parent, section: ConfigSection) -> None:
         """创建分区按钮"""
-        # 分区显示名称
-        section_names = {
-            ConfigSection.APP: "应用设置",
-            ConfigSection.PLUGINS: "插件设置",
-            ConfigSection.EVENT_BUS: "事件总线",
-            ConfigSection.LOGGING: "日志设置",
-            ConfigSection.AI: "AI设置",
-            ConfigSection.SECURITY: "安全设置",
-            ConfigSection.UI: "界面设置",
-            ConfigSection.STORAGE: "存储设置",
-            ConfigSection.METRICS: "指标设置",
-            ConfigSection.TESTING: "测试设置",
-            ConfigSection.ENVIRONMENT: "环境变量"
-        }
-        
-        section_name = section_names.get(section, section.value)
+        section_name = _SECTION_DISPLAY_NAMES.get(section, section.value)
         
         # 创建按钮
         button = ctk.CTkButton(
@@ -808,6 +1247,7 @@ class ConfigInterface(BaseWidget):
         }
         
         self._content_panel = ScrollPanel(parent, style=content_style)
+        self._content_panel.add_scroll_listener(self._schedule_visible_cards_render)
         content_widget = self._content_panel.get_widget()
         content_widget.grid(row=1, column=1, sticky="nsew", padx=0, pady=0)
         
@@ -826,14 +1266,48 @@ class ConfigInterface(BaseWidget):
         config = self._config_manager.config
         
         # 解析配置项
+        old_section_items = dict(self._items_by_section.get(self._current_section, {}))
         self._parse_config_items(config)
         
-        # 加载默认分区
-        self._load_section_config(self._current_section)
+        # 已显示当前分区时只更新有变化的卡片，否则加载默认分区
+        if self._config_cards or self._pending_cards:
+            self._apply_section_diff(self._current_section, old_section_items)
+        else:
+            self._load_section_config(self._current_section)
+        
+        if self._tree_view is not None:
+            self._populate_tree_view()
+            self._rebind_tree_detail_card()
+    
+    def _rebind_tree_detail_card(self) -> None:
+        """刷新后将树形视图详情卡片绑定到新的配置项，配置项已不存在时销毁卡片"""
+        card = self._tree_detail_card
+        if card is None:
+            return
+        
+        item_id = card.get_config_item().item_id
+        config_item = self._config_items.get(item_id)
+        if config_item is None:
+            card.destroy()
+            self._tree_detail_card = None
+            return
+        
+        card.update_config_item(config_item)
+        if self._tree_view.exists(item_id):
+            self._tree_view.selection_set(item_id)
+            self._tree_view.see(item_id)
     
     def _parse_config_items(self, config: SmallPanguConfig) -> None:
-        """解析配置项"""
+        """
+        解析配置项
+        
+        各分区按顺序在主线程解析：解析只涉及属性读取和ConfigItem创建，
+        属于纯Python的CPU工作，受GIL限制无法通过线程池并行，
+        且分区数量很少，线程调度和结果合并的开销会超过解析本身。
+        """
         self._config_items.clear()
+        self._items_by_section.clear()
+        self._modified_item_ids.clear()
         
         # 解析应用配置
         self._parse_section_config(ConfigSection.APP, config.app)
@@ -870,57 +1344,61 @@ class ConfigInterface(BaseWidget):
     
     def _parse_section_config(self, section: ConfigSection, section_config: BaseModel) -> None:
         """解析分区配置"""
-        for field_name, field_info in section_config.model_fields.items():
-            field_value = getattr(section_config, field_name, None)
+        for spec in _model_field_specs(type(section_config)):
+            field_value = getattr(section_config, spec.name, None)
             
             # 确定数据类型
-            if field_info.annotation == int:
-                data_type = "int"
-            elif field_info.annotation == float:
-                data_type = "float"
-            elif field_info.annotation == bool:
-                data_type = "bool"
-            elif field_info.annotation == str:
-                data_type = "str"
-            elif hasattr(field_info.annotation, "__origin__") and field_info.annotation.__origin__ == Literal:
-                data_type = "enum"
-            elif isinstance(field_value, Enum):
-                data_type = "enum"
-            else:
-                data_type = "str"
+            data_type = spec.data_type
+            if data_type is None:
+                data_type = "enum" if isinstance(field_value, Enum) else "str"
             
-            # 提取约束条件
-            constraints = {}
-            if field_info.json_schema_extra:
-                constraints.update(field_info.json_schema_extra)
+            # 约束条件（每个配置项持有独立副本）
+            constraints = dict(spec.extra_constraints)
             
             # 如果是枚举类型，添加枚举类信息
             if isinstance(field_value, Enum):
                 constraints["enum_class"] = type(field_value)
             
             # 创建配置项
-            item_id = f"{section.value}.{field_name}"
             config_item = ConfigItem(
                 section=section,
-                key=field_name,
+                key=spec.name,
                 value=field_value,
                 data_type=data_type,
-                description=field_info.description or "",
-                default_value=field_info.default,
+                description=spec.description,
+                default_value=spec.default,
                 constraints=constraints,
                 original_value=field_value
             )
             
+            item_id = config_item.item_id
             self._config_items[item_id] = config_item
+            self._items_by_section[section][item_id] = config_item
     
     def _load_section_config(self, section: ConfigSection) -> None:
         """加载分区配置"""
-        logger.debug_struct("加载分区配置", section=section.value)
-        
-        # 清理现有卡片
-        for card in self._config_cards.values():
-            card.destroy()
-        self._config_cards.clear()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug_struct("加载分区配置", section=section.value)
+        
+        section_items = self._items_by_section.get(section, {})
+        previous_section = self._shown_section
+        self._shown_section = section
+        
+        # 销毁已不存在的配置项（重新加载配置后被移除）的卡片和占位框架
+        for item_id in [item_id for item_id in self._config_cards if item_id not in self._config_items]:
+            self._config_cards.pop(item_id).destroy()
+        for item_id in [item_id for item_id in self._pending_cards if item_id not in self._config_items]:
+            self._pending_cards.pop(item_id)[1].destroy()
+        
+        # 其他分区的卡片只隐藏不销毁，切换回来时直接重新显示
+        for item_id, card in self._config_cards.items():
+            if item_id not in section_items:
+                card_widget = card.get_widget()
+                if card_widget:
+                    card_widget.pack_forget()
+        for item_id, (_, placeholder) in self._pending_cards.items():
+            if item_id not in section_items:
+                placeholder.pack_forget()
         
         # 获取内容框架
         content_frame = self._content_panel.get_content_frame()
@@ -930,41 +1408,199 @@ class ConfigInterface(BaseWidget):
         # 配置内容框架网格
         content_frame.grid_columnconfigure(0, weight=1)
         
-        # 创建该分区的配置卡片
-        section_items = [(item_id, item) for item_id, item in self._config_items.items() 
-                         if item.section == section]
+        # 按顺序显示该分区的卡片：已有卡片更新为当前配置项后重新显示，
+        # 缺少的配置项先创建轻量的占位框架，卡片在进入可视区域时再创建
+        repack = previous_section != section
+        self._freeze_layout(content_frame)
+        try:
+            for item_id, config_item in section_items.items():
+                card = self._config_cards.get(item_id)
+                if card is not None:
+                    card.update_config_item(config_item)
+                    card_widget = card.get_widget()
+                    if repack and card_widget:
+                        card_widget.pack(fill="x", padx=10, pady=5, anchor="nw")
+                    continue
+                
+                pending = self._pending_cards.get(item_id)
+                if pending is not None:
+                    placeholder = pending[1]
+                    self._pending_cards[item_id] = (config_item, placeholder)
+                    if repack:
+                        placeholder.pack(fill="x", padx=10, pady=5, anchor="nw")
+                    continue
+                
+                placeholder = ctk.CTkFrame(content_frame, fg_color="transparent", height=_CARD_PLACEHOLDER_HEIGHT)
+                placeholder.pack(fill="x", padx=10, pady=5, anchor="nw")
+                self._pending_cards[item_id] = (config_item, placeholder)
+        finally:
+            self._thaw_layout(content_frame)
+        
+        self._schedule_visible_cards_render()
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug_struct("分区配置加载完成", section=section.value, item_count=len(section_items))
+    
+    def _apply_section_diff(self, section: ConfigSection, old_items: Dict[str, ConfigItem]) -> None:
+        """
+        根据新旧配置项的差异更新当前分区的卡片
+        
+        只对新增、删除和值变化的配置项做组件操作，未变化的卡片保持不动。
         
-        for item_id, config_item in section_items:
-            self._create_config_card(content_frame, config_item)
+        Args:
+            section: 当前显示的分区
+            old_items: 重新解析前该分区的配置项
+        """
+        new_items = self._items_by_section.get(section, {})
+        old_keys = old_items.keys()
+        new_keys = new_items.keys()
+        
+        additions = new_keys - old_keys
+        deletions = old_keys - new_keys
+        modifications = set()
+        for item_id in new_keys & old_keys:
+            old_item = old_items[item_id]
+            if old_item.is_modified or new_items[item_id].value != old_item.value:
+                modifications.add(item_id)
+            else:
+                # 未变化的配置项沿用旧对象，卡片持有的引用保持有效
+                self._config_items[item_id] = old_item
+                new_items[item_id] = old_item
+        
+        for item_id in deletions:
+            card = self._config_cards.pop(item_id, None)
+            if card is not None:
+                card.destroy()
+            pending = self._pending_cards.pop(item_id, None)
+            if pending is not None:
+                pending[1].destroy()
+        
+        for item_id in modifications:
+            new_item = new_items[item_id]
+            if item_id in self._config_cards:
+                self._config_cards[item_id].update_config_item(new_item)
+            elif item_id in self._pending_cards:
+                self._pending_cards[item_id] = (new_item, self._pending_cards[item_id][1])
         
-        logger.debug_struct("分区配置加载完成", section=section.value, item_count=len(section_items))
+        content_frame = self._content_panel.get_content_frame()
+        if additions and content_frame:
+            self._freeze_layout(content_frame)
+            try:
+                for item_id, config_item in new_items.items():
+                    if item_id in additions:
+                        placeholder = ctk.CTkFrame(content_frame, fg_color="transparent", height=_CARD_PLACEHOLDER_HEIGHT)
+                        placeholder.pack(fill="x", padx=10, pady=5, anchor="nw")
+                        self._pending_cards[item_id] = (config_item, placeholder)
+            finally:
+                self._thaw_layout(content_frame)
+            self._schedule_visible_cards_render()
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug_struct("分区配置差异更新", 
+                               section=section.value,
+                               added=len(additions),
+                               removed=len(deletions),
+                               modified=len(modifications))
     
-    def _create_config_card(self, parent, config_item: ConfigItem) -> None:
-        """创建配置卡片"""
+    def _schedule_visible_cards_render(self) -> None:
+        """合并同一轮事件循环内的多次检查请求"""
+        if not self._pending_cards or self._visible_check_scheduled:
+            return
+        
+        content_widget = self._content_panel.get_widget() if self._content_panel else None
+        if content_widget is None:
+            self._render_visible_cards()
+            return
+        
+        self._visible_check_scheduled = True
+        content_widget.after_idle(self._render_visible_cards)
+    
+    def _render_visible_cards(self) -> None:
+        """将与可视区域相交的占位框架替换为配置卡片"""
+        self._visible_check_scheduled = False
+        if not self._pending_cards:
+            return
+        
+        # 隐藏分区的占位框架不参与渲染
+        shown_items = self._items_by_section.get(self._shown_section, {})
+        content_panel = self._content_panel
+        visible_ids = [
+            item_id for item_id, (_, placeholder) in self._pending_cards.items()
+            if item_id in shown_items and (content_panel is None or content_panel.is_in_viewport(placeholder))
+        ]
+        
+        if not visible_ids:
+            return
+        
+        # 每轮空闲回调最多创建一批卡片，其余留到下一轮，避免长时间阻塞界面
+        batch_ids = visible_ids[:_CARD_RENDER_BATCH_SIZE]
+        
+        # 整批替换完成后再统一计算一次布局
+        content_frame = self._pending_cards[batch_ids[0]][1].master
+        self._freeze_layout(content_frame)
+        try:
+            for item_id in batch_ids:
+                config_item, placeholder = self._pending_cards.pop(item_id)
+                self._create_config_card(content_frame, config_item, before=placeholder)
+                placeholder.destroy()
+        finally:
+            self._thaw_layout(content_frame)
+        
+        if len(visible_ids) > len(batch_ids):
+            self._schedule_visible_cards_render()
+    
+    @staticmethod
+    def _freeze_layout(widget) -> None:
+        """暂停组件随子组件变化调整尺寸（批量添加子组件前调用）"""
+        widget.pack_propagate(False)
+    
+    @staticmethod
+    def _thaw_layout(widget) -> None:
+        """恢复尺寸调整并一次性完成布局计算"""
+        widget.pack_propagate(True)
+        widget.update_idletasks()
+    
+    def _create_config_card(self, parent, config_item: ConfigItem, before: Optional[Any] = None) -> None:
+        """创建配置卡片（before指定时插入到该组件之前）"""
+        item_id = config_item.item_id
         try:
             config_card = ConfigCard(
                 parent,
                 config_item=config_item,
-                widget_id=f"config_card_{config_item.section.value}_{config_item.key}",
+                widget_id=f"config_card_{config_item.section_value}_{config_item.key}",
                 on_save=self._on_config_save,
-                on_reset=self._on_config_reset
+                on_reset=self._on_config_reset,
+                on_change=self._on_config_changed
             )
             
             card_widget = config_card.get_widget()
             if card_widget:
-                card_widget.pack(fill="x", padx=10, pady=5, anchor="nw")
+                if before is not None:
+                    card_widget.pack(fill="x", padx=10, pady=5, anchor="nw", before=before)
+                else:
+                    card_widget.pack(fill="x", padx=10, pady=5, anchor="nw")
             
             # 存储卡片引用
-            item_id = f"{config_item.section.value}.{config_item.key}"
             self._config_cards[item_id] = config_card
             
-            logger.debug_struct("配置卡片创建", section=config_item.section.value, key=config_item.key)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug_struct("配置卡片创建", item_id=item_id)
             
         except Exception as e:
-            logger.error_struct("配置卡片创建失败", 
-                               section=config_item.section.value, 
-                               key=config_item.key, 
-                               error=str(e))
+            logger.error_struct("配置卡片创建失败", item_id=item_id, error=str(e))
+    
+    def _on_config_changed(self, config_item: ConfigItem) -> None:
+        """
+        处理配置卡片中的值编辑，同步已修改集合
+        
+        Args:
+            config_item: 配置项
+        """
+        item_id = config_item.item_id
+        if config_item.is_modified:
+            self._modified_item_ids.add(item_id)
+        else:
+            self._modified_item_ids.discard(item_id)
     
     def _on_config_save(self, config_item: ConfigItem) -> None:
         """
@@ -973,40 +1609,60 @@ class ConfigInterface(BaseWidget):
         Args:
             config_item: 配置项
         """
-        logger.debug_struct("配置保存请求", 
-                           section=config_item.section.value, 
-                           key=config_item.key,
-                           value=config_item.value)
+        # 值未修改时无需写入配置
+        if not config_item.is_modified and config_item.value == config_item.original_value:
+            return
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug_struct("配置保存请求", 
+                               section=config_item.section_value, 
+                               key=config_item.key,
+                               value=config_item.value)
         
         # 调用配置管理器保存配置
         if self._config_manager:
-            full_key = f"{config_item.section.value}.{config_item.key}"
-            success = self._config_manager.set_value(full_key, config_item.value, persistent=True)
+            success = self._config_manager.set_value(config_item.item_id, config_item.value, persistent=True)
             if not success:
-                logger.error_struct("配置保存失败", 
-                                  section=config_item.section.value, 
-                                  key=config_item.key,
-                                  value=config_item.value)
+                self._log_save_failure(config_item)
                 # 可以考虑显示错误消息给用户
                 return
         
+        self._finish_config_save(config_item)
+    
+    def _log_save_failure(self, config_item: ConfigItem) -> None:
+        """记录配置保存失败"""
+        logger.error_struct("配置保存失败", 
+                          section=config_item.section_value, 
+                          key=config_item.key,
+                          value=config_item.value)
+    
+    def _finish_config_save(self, config_item: ConfigItem, skip_event: bool = False) -> None:
+        """
+        配置值写入配置管理器后的处理：发布事件、更新原始值和卡片
+        
+        Args:
+            config_item: 已保存的配置项
+            skip_event: 是否跳过单项保存事件（批量保存时由调用方统一发布）
+        """
         # 发布事件（供其他组件监听）
-        if self._event_bus:
+        if self._event_bus and not skip_event and self._event_bus.has_subscribers("config.save_request"):
             self._event_bus.publish("config.save_request", {
-                "section": config_item.section.value,
+                "section": config_item.section_value,
                 "key": config_item.key,
-                "value": config_item.value,
-                "timestamp": "now"
+                "value": config_item.value
             })
         
         # 更新原始值
-        config_item.original_value = copy.deepcopy(config_item.value)
+        config_item.original_value = _copy_value(config_item.value)
         config_item.is_modified = False
         
         # 更新卡片样式
-        item_id = f"{config_item.section.value}.{config_item.key}"
-        if item_id in self._config_cards:
-            self._config_cards[item_id].update_config_item(config_item)
+        item_id = config_item.item_id
+        self._modified_item_ids.discard(item_id)
+        card = self._config_cards.get(item_id)
+        if card is not None:
+            card.update_config_item(config_item)
+        self._refresh_tree_item(item_id)
     
     def _on_config_reset(self, config_item: ConfigItem) -> None:
         """
@@ -1015,42 +1671,91 @@ class ConfigInterface(BaseWidget):
         Args:
             config_item: 配置项
         """
-        logger.debug_struct("配置重置请求", 
-                           section=config_item.section.value, 
-                           key=config_item.key)
+        # 值未修改时无需重置
+        if not config_item.is_modified and config_item.value == config_item.original_value:
+            return
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug_struct("配置重置请求", 
+                               section=config_item.section_value, 
+                               key=config_item.key)
         
         # 重置为原始值
-        config_item.value = copy.deepcopy(config_item.original_value)
+        config_item.value = _copy_value(config_item.original_value)
         config_item.is_modified = False
         
         # 更新卡片
-        item_id = f"{config_item.section.value}.{config_item.key}"
-        if item_id in self._config_cards:
-            self._config_cards[item_id].update_config_item(config_item)
+        item_id = config_item.item_id
+        self._modified_item_ids.discard(item_id)
+        card = self._config_cards.get(item_id)
+        if card is not None:
+            card.update_config_item(config_item)
+        self._refresh_tree_item(item_id)
     
     def _save_all_changes(self) -> None:
         """保存所有更改"""
         logger.debug("保存所有更改")
         
-        modified_items = [item for item in self._config_items.values() if item.is_modified]
+        self._flush_pending_validations()
+        # 刷新后已被移除的配置项不再处理
+        modified_items = [
+            self._config_items[item_id] for item_id in self._modified_item_ids
+            if item_id in self._config_items
+        ]
+        
+        # 一次写入全部更改，配置文件只保存一次
+        if self._config_manager and modified_items:
+            results = self._config_manager.set_values(
+                [(item.item_id, item.value) for item in modified_items],
+                persistent=True
+            )
+        else:
+            results = None
         
+        # 没有订阅者时不构造批量保存事件数据
+        publish_batch = bool(self._event_bus) and self._event_bus.has_subscribers("config.batch_save_request")
+        saved_changes = []
         for item in modified_items:
-            self._on_config_save(item)
+            if results is not None and not results.get(item.item_id, False):
+                self._log_save_failure(item)
+                continue
+            if publish_batch:
+                saved_changes.append({
+                    "section": item.section_value,
+                    "key": item.key,
+                    "value": item.value
+                })
+            self._finish_config_save(item, skip_event=True)
         
         logger.debug_struct("所有更改保存完成", modified_count=len(modified_items))
         
-        # 发布事件
-        if self._event_bus:
+        # 发布事件（批量保存只发布一次保存事件）
+        if saved_changes:
+            self._event_bus.publish("config.batch_save_request", {
+                "changes": saved_changes
+            })
+        if self._event_bus and self._event_bus.has_subscribers("config.all_saved"):
             self._event_bus.publish("config.all_saved", {
-                "modified_count": len(modified_items),
-                "timestamp": "now"
+                "modified_count": len(modified_items)
             })
     
+    def _flush_pending_validations(self) -> None:
+        """立即执行所有卡片尚未触发的延迟验证"""
+        for card in self._config_cards.values():
+            card.flush_pending_validation()
+        if self._tree_detail_card is not None:
+            self._tree_detail_card.flush_pending_validation()
+    
     def _reset_all_changes(self) -> None:
         """重置所有更改"""
         logger.debug("重置所有更改")
         
-        modified_items = [item for item in self._config_items.values() if item.is_modified]
+        self._flush_pending_validations()
+        # 刷新后已被移除的配置项不再处理
+        modified_items = [
+            self._config_items[item_id] for item_id in self._modified_item_ids
+            if item_id in self._config_items
+        ]
         
         for item in modified_items:
             self._on_config_reset(item)
@@ -1063,7 +1768,7 @@ class ConfigInterface(BaseWidget):
     
     def get_modified_count(self) -> int:
         """获取已修改的配置项数量"""
-        return len([item for item in self._config_items.values() if item.is_modified])
+        return len(self._modified_item_ids)
     
     def get_status(self) -> Dict[str, Any]:
         """获取配置管理界面状态"""
@@ -1109,6 +1814,9 @@ class ConfigView:
         self._main_frame = None
         self._config_interface = None
         
+        # 待执行的刷新任务ID（连续的配置变更事件只刷新一次）
+        self._refresh_pending: Optional[str] = None
+        
         # 初始化
         self._initialize()
         
@@ -1148,41 +1856,35 @@ class ConfigView:
             raise UIError(f"配置管理视图初始化失败: {e}")
     
     def _subscribe_events(self) -> None:
-        """订阅事件"""
-        # 配置更新事件
-        self._event_bus.subscribe("config.updated", self._on_config_updated)
-        
-        # 配置重载事件
-        self._event_bus.subscribe("config.reloaded", self._on_config_reloaded)
-        
-        # 环境变量变更事件
-        self._event_bus.subscribe("environment.changed", self._on_environment_changed)
+        """订阅事件（配置更新、配置重载、环境变量变更均由同一处理函数刷新界面）"""
+        for event_type in _CONFIG_REFRESH_EVENTS:
+            self._event_bus.subscribe(event_type, self._on_config_event)
     
-    def _on_config_updated(self, event) -> None:
-        """处理配置更新"""
-        data = event.data
-        section = data.get("section")
-        key = data.get("key")
-        
-        logger.debug_struct("配置更新", section=section, key=key)
+    def _on_config_event(self, event) -> None:
+        """处理需要刷新配置界面的事件"""
+        if event.type == "config.updated":
+            data = event.data or {}
+            logger.debug_struct("配置更新", section=data.get("section"), key=data.get("key"))
+        else:
+            logger.debug_struct("配置事件", event_type=event.type)
         
         # 刷新配置界面
-        if self._config_interface:
-            self._config_interface.refresh_config()
+        self._schedule_refresh()
     
-    def _on_config_reloaded(self, event) -> None:
-        """处理配置重载"""
-        logger.debug("配置重载")
+    def _schedule_refresh(self) -> None:
+        """延迟刷新配置界面，合并短时间内的多次刷新请求"""
+        if not self._config_interface or self._refresh_pending is not None:
+            return
         
-        # 刷新配置界面
-        if self._config_interface:
+        if self._main_frame is None:
             self._config_interface.refresh_config()
-    
-    def _on_environment_changed(self, event) -> None:
-        """处理环境变量变更"""
-        logger.debug("环境变量变更")
+            return
         
-        # 刷新配置界面
+        self._refresh_pending = self._main_frame.after(_REFRESH_DEBOUNCE_MS, self._do_refresh)
+    
+    def _do_refresh(self) -> None:
+        """执行合并后的刷新"""
+        self._refresh_pending = None
         if self._config_interface:
             self._config_interface.refresh_config()
     
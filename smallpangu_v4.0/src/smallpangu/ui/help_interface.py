@@ -13,25 +13,64 @@
 import customtkinter as ctk
 import logging
 import webbrowser
+import os
 import sys
 import platform
-from typing import Dict, Any, Optional, List, Callable, Union
+from typing import Dict, Any, Optional, Callable, Union, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache, partial
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 import time
 
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None
+    PSUTIL_AVAILABLE = False
+
 from ..core.events import EventBus
 from ..core.di import Container
 from ..config.manager import ConfigManager
 from ..config.models import AppConfig
 from .manager import UIManager
-from .widgets import BaseWidget, Panel, ScrollPanel, Card, Button, Label, Switch, TextArea
+from .widgets import BaseWidget, Panel, ScrollPanel, Card, Button, Label, Switch, TextArea, WidgetStyle, _DATACLASS_SLOTS
 from ..core.errors import UIError
 from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 合并短时间内多个 help.request 事件的窗口（毫秒，约一帧）
+_HELP_REQUEST_COALESCE_MS = 16
+
+# 帮助视图未初始化时的状态（共享对象，调用方不得修改）
+_UNINIT_STATUS: Dict[str, Any] = {"initialized": False}
+
+# 共享的卡片样式与字体（Card 只读取样式，不会修改）
+_CARD_STYLE = WidgetStyle(
+    fg_color=("white", "gray20"),
+    border_color=("gray80", "gray40"),
+    border_width=1,
+    corner_radius=10
+)
+_FONT_ICON = ("Segoe UI Emoji", 16)
+_FONT_PAGE_TITLE = ("Microsoft YaHei", 20, "bold")
+_FONT_TITLE = ("Microsoft YaHei", 14, "bold")
+_FONT_BODY = ("Microsoft YaHei", 11)
+_FONT_INFO = ("Microsoft YaHei", 10)
+
+# 系统信息缓存有效期（秒），避免快速刷新时重复调用 psutil
+_SYSTEM_INFO_TTL = 2.0
+# 后台采集资源信息的轮询间隔（毫秒）
+_SYSTEM_INFO_POLL_MS = 50
+# 资源信息字段及其加载占位文本
+_RESOURCE_INFO_KEYS = ("CPU使用率", "CPU核心数", "内存使用", "内存使用率")
+_LOADING_TEXT = "加载中..."
+# psutil 调用放到单独的工作线程，不阻塞 Tk 主循环
+_SYSTEM_INFO_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="help-sysinfo")
+
 
 class HelpViewType(str, Enum):
     """帮助视图类型枚举"""
@@ -41,20 +80,182 @@ class HelpViewType(str, Enum):
     FAQ = "faq"                          # 常见问题
     SYSTEM_INFO = "system_info"          # 系统信息
     ABOUT = "about"                      # 关于页面
+    
+    @property
+    def display_title(self) -> str:
+        """视图显示标题"""
+        return _TITLES.get(self, "帮助")
+
+
+# 视图显示标题
+_TITLES: Dict[HelpViewType, str] = {
+    HelpViewType.GETTING_STARTED: "🚀 入门指南",
+    HelpViewType.USER_GUIDE: "📚 用户指南",
+    HelpViewType.SHORTCUTS: "⌨️ 快捷键",
+    HelpViewType.FAQ: "❓ 常见问题",
+    HelpViewType.SYSTEM_INFO: "💻 系统信息",
+    HelpViewType.ABOUT: "ℹ️ 关于"
+}
+
 
+# 纯文本问答/列表类视图，用单个文本框渲染而不是逐节创建卡片
+_TEXT_VIEW_TYPES = frozenset({HelpViewType.SHORTCUTS, HelpViewType.FAQ})
+# 文本视图每行估算高度（像素），用于设置文本框高度以免内部滚动
+_TEXT_VIEW_LINE_HEIGHT = 22
 
+# 静态帮助内容：视图类型 -> ((标题, 内容), ...)，导入时构建一次
+_STATIC_HELP_DATA: Dict[HelpViewType, Tuple[Tuple[str, str], ...]] = {
+    # 入门指南
+    HelpViewType.GETTING_STARTED: (
+        (
+            "欢迎使用小盘古 4.0",
+            "小盘古 4.0 是一个现代化、插件化的AI助手系统。"
+            "本指南将帮助您快速上手使用系统。"
+        ),
+        (
+            "首次使用步骤",
+            "1. 配置您的API密钥和模型设置\n"
+            "2. 安装需要的插件\n"
+            "3. 开始对话或执行任务"
+        ),
+        (
+            "核心概念",
+            "• 插件系统: 可插拔的功能模块\n"
+            "• 事件总线: 组件间通信机制\n"
+            "• 配置管理: 统一的配置系统\n"
+            "• 主题切换: 支持深色/浅色主题"
+        ),
+    ),
+    # 用户指南
+    HelpViewType.USER_GUIDE: (
+        (
+            "聊天功能",
+            "在聊天界面中，您可以与AI助手对话，支持：\n"
+            "• 文本对话\n"
+            "• 上下文记忆\n"
+            "• 对话历史\n"
+            "• 快捷指令"
+        ),
+        (
+            "插件管理",
+            "插件管理界面允许您：\n"
+            "• 查看已安装插件\n"
+            "• 启用/禁用插件\n"
+            "• 配置插件参数\n"
+            "• 安装新插件"
+        ),
+        (
+            "配置管理",
+            "配置管理界面提供：\n"
+            "• 系统设置调整\n"
+            "• 主题和外观设置\n"
+            "• 插件配置管理\n"
+            "• 配置导入/导出"
+        ),
+        (
+            "系统监控",
+            "监控界面显示：\n"
+            "• 系统资源使用情况\n"
+            "• 插件状态\n"
+            "• 性能指标\n"
+            "• 实时图表"
+        ),
+    ),
+    # 快捷键
+    HelpViewType.SHORTCUTS: (
+        (
+            "通用快捷键",
+            "Ctrl+N: 新建对话\n"
+            "Ctrl+S: 保存配置\n"
+            "Ctrl+Q: 退出应用\n"
+            "Ctrl+T: 切换主题\n"
+            "F1: 显示帮助"
+        ),
+        (
+            "编辑快捷键",
+            "Ctrl+C: 复制\n"
+            "Ctrl+V: 粘贴\n"
+            "Ctrl+X: 剪切\n"
+            "Ctrl+Z: 撤销\n"
+            "Ctrl+Y: 重做"
+        ),
+        (
+            "导航快捷键",
+            "Ctrl+1: 切换到聊天视图\n"
+            "Ctrl+2: 切换到插件视图\n"
+            "Ctrl+3: 切换到配置视图\n"
+            "Ctrl+4: 切换到监控视图\n"
+            "Ctrl+5: 切换到帮助视图"
+        ),
+    ),
+    # 常见问题
+    HelpViewType.FAQ: (
+        (
+            "如何安装插件？",
+            "1. 打开插件管理界面\n"
+            "2. 点击'安装插件'按钮\n"
+            "3. 选择插件文件或输入插件URL\n"
+            "4. 点击安装并重启应用"
+        ),
+        (
+            "如何配置API密钥？",
+            "1. 打开配置管理界面\n"
+            "2. 导航到AI配置部分\n"
+            "3. 输入您的API密钥\n"
+            "4. 保存配置并重启应用"
+        ),
+        (
+            "如何切换主题？",
+            "1. 点击状态栏的主题切换按钮\n"
+            "2. 或在配置管理界面的UI设置中更改主题"
+        ),
+        (
+            "如何导出对话记录？",
+            "功能正在开发中，将在后续版本中提供。"
+        ),
+    ),
+}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class HelpSection:
-    """帮助章节"""
-    
-    def __init__(self, title: str, content: str, view_type: HelpViewType):
-        self.title = title
-        self.content = content
-        self.view_type = view_type
-        self.children: List['HelpSection'] = []
-    
-    def add_child(self, child: 'HelpSection') -> None:
-        """添加子章节"""
-        self.children.append(child)
+    """帮助章节（静态内容，各界面实例共享，因此不可变）"""
+    title: str
+    content: str
+    view_type: HelpViewType
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class HelpRequestData:
+    """help.request 事件数据"""
+    topic: str
+
+
+@lru_cache(maxsize=None)
+def _get_help_sections(view_type: HelpViewType) -> Tuple[HelpSection, ...]:
+    """按视图类型构建帮助章节（每个视图只构建一次，各实例共享）"""
+    return tuple(
+        HelpSection(title, content, view_type)
+        for title, content in _STATIC_HELP_DATA.get(view_type, ())
+    )
+
+
+@lru_cache(maxsize=1)
+def _static_platform_info() -> Dict[str, Dict[str, str]]:
+    """获取进程生命周期内不变的平台信息（只查询一次）"""
+    return {
+        "Python环境": {
+            "Python版本": platform.python_version(),
+            "Python实现": platform.python_implementation(),
+            "Python路径": sys.executable
+        },
+        "操作系统": {
+            "操作系统": platform.system(),
+            "系统版本": platform.version(),
+            "系统架构": platform.machine(),
+            "处理器": platform.processor()
+        }
+    }
 
 
 class HelpCard(BaseWidget):
@@ -98,12 +299,7 @@ class HelpCard(BaseWidget):
     def create_widget(self) -> ctk.CTkBaseClass:
         """创建帮助卡片组件"""
         # 创建卡片
-        self._card = Card(self._parent, style={
-            "fg_color": ("white", "gray20"),
-            "border_color": ("gray80", "gray40"),
-            "border_width": 1,
-            "corner_radius": 10
-        })
+        self._card = Card(self._parent, style=_CARD_STYLE)
         card_widget = self._card.get_widget()
         
         # 配置卡片网格
@@ -122,7 +318,7 @@ class HelpCard(BaseWidget):
             icon_label = ctk.CTkLabel(
                 title_frame,
                 text=self._icon,
-                font=("Segoe UI Emoji", 16),
+                font=_FONT_ICON,
                 anchor="w"
             )
             icon_label.pack(side="left", padx=(0, 10))
@@ -131,7 +327,7 @@ class HelpCard(BaseWidget):
         self._title_label = ctk.CTkLabel(
             title_frame,
             text=self._title,
-            font=("Microsoft YaHei", 14, "bold"),
+            font=_FONT_TITLE,
             anchor="w"
         )
         self._title_label.pack(side="left", fill="x", expand=True)
@@ -140,7 +336,7 @@ class HelpCard(BaseWidget):
         self._content_label = ctk.CTkLabel(
             content_frame,
             text=self._content,
-            font=("Microsoft YaHei", 11),
+            font=_FONT_BODY,
             anchor="w",
             justify="left",
             wraplength=400
@@ -174,6 +370,23 @@ class HelpInterface(BaseWidget):
     提供完整的帮助文档系统和用户支持功能
     """
     
+    # 侧边栏导航项：(视图类型, 标题, 描述)
+    _NAV_ITEMS: Tuple[Tuple[HelpViewType, str, str], ...] = (
+        (HelpViewType.GETTING_STARTED, "🚀 入门指南", "快速上手使用系统"),
+        (HelpViewType.USER_GUIDE, "📚 用户指南", "详细功能说明"),
+        (HelpViewType.SHORTCUTS, "⌨️ 快捷键", "键盘快捷键列表"),
+        (HelpViewType.FAQ, "❓ 常见问题", "常见问题解答"),
+        (HelpViewType.SYSTEM_INFO, "💻 系统信息", "查看系统状态"),
+        (HelpViewType.ABOUT, "ℹ️ 关于", "版本信息和许可")
+    )
+    
+    # 关于页面的外部链接
+    _LINKS: Dict[str, str] = {
+        "project": "https://github.com/smallpangu",
+        "docs": "https://smallpangu.github.io/docs",
+        "feedback": "https://github.com/smallpangu/issues"
+    }
+    
     def __init__(
         self,
         parent,
@@ -199,157 +412,38 @@ class HelpInterface(BaseWidget):
         
         # 视图状态
         self._view_type = HelpViewType.GETTING_STARTED
-        self._help_sections: Dict[HelpViewType, List[HelpSection]] = {}
+        # 状态版本号，视图切换时递增，供外部判断状态是否变化
+        self._state_epoch = 0
+        # 已加载的帮助章节（按视图懒加载）
+        self._help_sections: Dict[HelpViewType, Tuple[HelpSection, ...]] = {}
+        
+        # 系统信息缓存
+        self._sysinfo_cache: Optional[Dict[str, Dict[str, str]]] = None
+        self._sysinfo_ts = 0.0
         
         # UI组件
         self._main_panel = None
         self._sidebar = None
         self._content_area = None
-        
-        # 初始化帮助内容
-        self._initialize_help_content()
+        self._page_frame = None
+        # 已构建的视图页面，切换时隐藏/显示而不是重建
+        self._view_frames: Dict[HelpViewType, ctk.CTkFrame] = {}
+        # 当前处于选中样式的导航按钮
+        self._selected_nav: Optional[HelpViewType] = None
         
         # 初始化
         self.initialize()
         
         logger.debug_struct("帮助界面初始化", widget_id=self._widget_id)
     
-    def _initialize_help_content(self) -> None:
-        """初始化帮助内容"""
-        logger.debug("初始化帮助内容")
-        
-        # 入门指南
-        getting_started = [
-            HelpSection(
-                "欢迎使用小盘古 4.0",
-                "小盘古 4.0 是一个现代化、插件化的AI助手系统。"
-                "本指南将帮助您快速上手使用系统。",
-                HelpViewType.GETTING_STARTED
-            ),
-            HelpSection(
-                "首次使用步骤",
-                "1. 配置您的API密钥和模型设置\n"
-                "2. 安装需要的插件\n"
-                "3. 开始对话或执行任务",
-                HelpViewType.GETTING_STARTED
-            ),
-            HelpSection(
-                "核心概念",
-                "• 插件系统: 可插拔的功能模块\n"
-                "• 事件总线: 组件间通信机制\n"
-                "• 配置管理: 统一的配置系统\n"
-                "• 主题切换: 支持深色/浅色主题",
-                HelpViewType.GETTING_STARTED
-            )
-        ]
-        self._help_sections[HelpViewType.GETTING_STARTED] = getting_started
-        
-        # 用户指南
-        user_guide = [
-            HelpSection(
-                "聊天功能",
-                "在聊天界面中，您可以与AI助手对话，支持：\n"
-                "• 文本对话\n"
-                "• 上下文记忆\n"
-                "• 对话历史\n"
-                "• 快捷指令",
-                HelpViewType.USER_GUIDE
-            ),
-            HelpSection(
-                "插件管理",
-                "插件管理界面允许您：\n"
-                "• 查看已安装插件\n"
-                "• 启用/禁用插件\n"
-                "• 配置插件参数\n"
-                "• 安装新插件",
-                HelpViewType.USER_GUIDE
-            ),
-            HelpSection(
-                "配置管理",
-                "配置管理界面提供：\n"
-                "• 系统设置调整\n"
-                "• 主题和外观设置\n"
-                "• 插件配置管理\n"
-                "• 配置导入/导出",
-                HelpViewType.USER_GUIDE
-            ),
-            HelpSection(
-                "系统监控",
-                "监控界面显示：\n"
-                "• 系统资源使用情况\n"
-                "• 插件状态\n"
-                "• 性能指标\n"
-                "• 实时图表",
-                HelpViewType.USER_GUIDE
-            )
-        ]
-        self._help_sections[HelpViewType.USER_GUIDE] = user_guide
-        
-        # 快捷键
-        shortcuts = [
-            HelpSection(
-                "通用快捷键",
-                "Ctrl+N: 新建对话\n"
-                "Ctrl+S: 保存配置\n"
-                "Ctrl+Q: 退出应用\n"
-                "Ctrl+T: 切换主题\n"
-                "F1: 显示帮助",
-                HelpViewType.SHORTCUTS
-            ),
-            HelpSection(
-                "编辑快捷键",
-                "Ctrl+C: 复制\n"
-                "Ctrl+V: 粘贴\n"
-                "Ctrl+X: 剪切\n"
-                "Ctrl+Z: 撤销\n"
-                "Ctrl+Y: 重做",
-                HelpViewType.SHORTCUTS
-            ),
-            HelpSection(
-                "导航快捷键",
-                "Ctrl+1: 切换到聊天视图\n"
-                "Ctrl+2: 切换到插件视图\n"
-                "Ctrl+3: 切换到配置视图\n"
-                "Ctrl+4: 切换到监控视图\n"
-                "Ctrl+5: 切换到帮助视图",
-                HelpViewType.SHORTCUTS
-            )
-        ]
-        self._help_sections[HelpViewType.SHORTCUTS] = shortcuts
-        
-        # 常见问题
-        faq = [
-            HelpSection(
-                "如何安装插件？",
-                "1. 打开插件管理界面\n"
-                "2. 点击'安装插件'按钮\n"
-                "3. 选择插件文件或输入插件URL\n"
-                "4. 点击安装并重启应用",
-                HelpViewType.FAQ
-            ),
-            HelpSection(
-                "如何配置API密钥？",
-                "1. 打开配置管理界面\n"
-                "2. 导航到AI配置部分\n"
-                "3. 输入您的API密钥\n"
-                "4. 保存配置并重启应用",
-                HelpViewType.FAQ
-            ),
-            HelpSection(
-                "如何切换主题？",
-                "1. 点击状态栏的主题切换按钮\n"
-                "2. 或在配置管理界面的UI设置中更改主题",
-                HelpViewType.FAQ
-            ),
-            HelpSection(
-                "如何导出对话记录？",
-                "功能正在开发中，将在后续版本中提供。",
-                HelpViewType.FAQ
-            )
-        ]
-        self._help_sections[HelpViewType.FAQ] = faq
-        
-        logger.debug_struct("帮助内容初始化完成", section_count=len(self._help_sections))
+    def _sections_for(self, view_type: HelpViewType) -> Tuple[HelpSection, ...]:
+        """获取视图的帮助章节（首次导航到该视图时才加载）"""
+        sections = self._help_sections.get(view_type)
+        if sections is None:
+            sections = _get_help_sections(view_type)
+            self._help_sections[view_type] = sections
+            logger.debug_struct("帮助内容加载完成", view_type=view_type.value, section_count=len(sections))
+        return sections
     
     def create_widget(self) -> ctk.CTkBaseClass:
         """创建帮助界面组件"""
@@ -404,7 +498,7 @@ class HelpInterface(BaseWidget):
         title_label = ctk.CTkLabel(
             title_frame,
             text="帮助主题",
-            font=("Microsoft YaHei", 14, "bold"),
+            font=_FONT_TITLE,
             anchor="center"
         )
         title_label.pack(expand=True, fill="both", padx=20, pady=10)
@@ -416,16 +510,7 @@ class HelpInterface(BaseWidget):
         # 创建导航按钮
         self._nav_buttons: Dict[HelpViewType, ctk.CTkButton] = {}
         
-        nav_items = [
-            (HelpViewType.GETTING_STARTED, "🚀 入门指南", "快速上手使用系统"),
-            (HelpViewType.USER_GUIDE, "📚 用户指南", "详细功能说明"),
-            (HelpViewType.SHORTCUTS, "⌨️ 快捷键", "键盘快捷键列表"),
-            (HelpViewType.FAQ, "❓ 常见问题", "常见问题解答"),
-            (HelpViewType.SYSTEM_INFO, "💻 系统信息", "查看系统状态"),
-            (HelpViewType.ABOUT, "ℹ️ 关于", "版本信息和许可")
-        ]
-        
-        for view_type, title, description in nav_items:
+        for view_type, title, description in self._NAV_ITEMS:
             self._create_nav_button(nav_frame, view_type, title, description)
         
         # 注册组件
@@ -474,14 +559,17 @@ class HelpInterface(BaseWidget):
         self._update_nav_button_states(view_type)
     
     def _update_nav_button_states(self, selected_type: HelpViewType) -> None:
-        """更新导航按钮状态"""
-        for view_type, button in self._nav_buttons.items():
-            if view_type == selected_type:
-                # 选中状态
-                button.configure(fg_color=("gray75", "gray25"))
-            else:
-                # 默认状态
-                button.configure(fg_color="transparent")
+        """更新导航按钮状态（只重设样式发生变化的两个按钮）"""
+        if selected_type == self._selected_nav:
+            return
+        
+        # 恢复之前选中按钮的默认状态
+        if self._selected_nav is not None:
+            self._nav_buttons[self._selected_nav].configure(fg_color="transparent")
+        
+        # 选中状态
+        self._nav_buttons[selected_type].configure(fg_color=("gray75", "gray25"))
+        self._selected_nav = selected_type
     
     def _create_content_area(self, parent) -> None:
         """创建内容区域"""
@@ -506,66 +594,133 @@ class HelpInterface(BaseWidget):
         # 注册组件
         self.register_widget("content_area", content_widget)
     
+    @staticmethod
+    def _create_page_frame(content_frame) -> ctk.CTkFrame:
+        """创建承载单个视图全部内容的页面框架"""
+        page_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
+        page_frame.grid(row=0, column=0, sticky="nsew")
+        page_frame.grid_columnconfigure(0, weight=1)
+        return page_frame
+    
     def _load_view(self, view_type: HelpViewType) -> None:
         """加载视图"""
         logger.debug_struct("加载帮助视图", view_type=view_type.value)
         
-        # 清空内容区域
         content_frame = self._content_area.get_content_frame()
         if not content_frame:
             return
         
-        for widget in content_frame.winfo_children():
-            widget.destroy()
+        # 隐藏当前页面
+        if self._page_frame is not None:
+            self._page_frame.grid_remove()
+        
+        # 已构建过的视图直接重新显示
+        page_frame = self._view_frames.get(view_type)
+        if page_frame is not None:
+            page_frame.grid()
+            self._page_frame = page_frame
+            return
+        
+        page_frame = self._create_page_frame(content_frame)
+        self._view_frames[view_type] = page_frame
+        self._page_frame = page_frame
         
         # 根据视图类型加载内容
         if view_type == HelpViewType.SYSTEM_INFO:
-            self._load_system_info_view(content_frame)
+            self._load_system_info_view(page_frame)
         elif view_type == HelpViewType.ABOUT:
-            self._load_about_view(content_frame)
+            self._load_about_view(page_frame)
+        elif view_type in _TEXT_VIEW_TYPES:
+            self._load_text_view(page_frame, view_type)
         else:
-            self._load_help_content_view(content_frame, view_type)
+            self._load_help_content_view(page_frame, view_type)
     
     def _load_help_content_view(self, parent, view_type: HelpViewType) -> None:
         """加载帮助内容视图"""
         # 视图标题
-        title_texts = {
-            HelpViewType.GETTING_STARTED: "🚀 入门指南",
-            HelpViewType.USER_GUIDE: "📚 用户指南",
-            HelpViewType.SHORTCUTS: "⌨️ 快捷键",
-            HelpViewType.FAQ: "❓ 常见问题"
-        }
-        
-        title = title_texts.get(view_type, "帮助")
+        title = view_type.display_title
         
         title_label = ctk.CTkLabel(
             parent,
             text=title,
-            font=("Microsoft YaHei", 20, "bold"),
+            font=_FONT_PAGE_TITLE,
             anchor="w"
         )
         title_label.grid(row=0, column=0, sticky="w", padx=30, pady=(30, 20))
         
         # 加载帮助内容
-        sections = self._help_sections.get(view_type, [])
-        
-        for i, section in enumerate(sections, 1):
-            # 创建帮助卡片
-            help_card = HelpCard(
-                parent,
-                title=section.title,
-                content=section.content,
-                widget_id=f"help_card_{view_type.value}_{i}",
-                icon="•"
-            )
-            
-            card_widget = help_card.get_widget()
-            if card_widget:
-                card_widget.grid(row=i, column=0, sticky="nsew", padx=30, pady=(0, 15))
+        sections = self._sections_for(view_type)
         
-        # 添加底部空白
+        # 添加底部空白（行号固定，可先于卡片放置）
         bottom_spacer = ctk.CTkFrame(parent, fg_color="transparent", height=20)
         bottom_spacer.grid(row=len(sections) + 1, column=0, sticky="nsew")
+        
+        # 第一张卡片立即创建，其余在空闲时逐张创建
+        self._build_help_card(parent, view_type, sections, 0)
+    
+    def _load_text_view(self, parent, view_type: HelpViewType) -> None:
+        """加载纯文本帮助视图（所有章节写入同一个只读文本框）"""
+        title_label = ctk.CTkLabel(
+            parent,
+            text=view_type.display_title,
+            font=_FONT_PAGE_TITLE,
+            anchor="w"
+        )
+        title_label.grid(row=0, column=0, sticky="w", padx=30, pady=(30, 20))
+        
+        sections = self._sections_for(view_type)
+        line_count = sum(section.content.count("\n") + 3 for section in sections)
+        
+        textbox = ctk.CTkTextbox(
+            parent,
+            wrap="word",
+            font=_FONT_BODY,
+            height=line_count * _TEXT_VIEW_LINE_HEIGHT,
+            fg_color=_CARD_STYLE.fg_color,
+            border_color=_CARD_STYLE.border_color,
+            border_width=_CARD_STYLE.border_width,
+            corner_radius=_CARD_STYLE.corner_radius
+        )
+        textbox.grid(row=1, column=0, sticky="nsew", padx=30, pady=(0, 15))
+        
+        # CTkTextbox 的标签不允许设置字体，标题用颜色和段间距区分
+        textbox.tag_config("heading", foreground="#3B8ED0", spacing1=10, spacing3=4)
+        textbox.tag_config("body", lmargin1=16, lmargin2=16)
+        
+        for section in sections:
+            textbox.insert("end", f"• {section.title}\n", "heading")
+            textbox.insert("end", f"{section.content}\n\n", "body")
+        
+        textbox.configure(state="disabled")
+    
+    def _build_help_card(
+        self,
+        parent,
+        view_type: HelpViewType,
+        sections: Tuple[HelpSection, ...],
+        index: int
+    ) -> None:
+        """创建一张帮助卡片，并在空闲时调度下一张"""
+        if index >= len(sections) or not parent.winfo_exists():
+            return
+        
+        section = sections[index]
+        row = index + 1
+        
+        # 创建帮助卡片
+        help_card = HelpCard(
+            parent,
+            title=section.title,
+            content=section.content,
+            widget_id=f"help_card_{view_type.value}_{row}",
+            icon="•"
+        )
+        
+        card_widget = help_card.get_widget()
+        if card_widget:
+            card_widget.grid(row=row, column=0, sticky="nsew", padx=30, pady=(0, 15))
+        
+        parent.after_idle(self._build_help_card, parent, view_type, sections, index + 1)
     
     def _load_system_info_view(self, parent) -> None:
         """加载系统信息视图"""
@@ -573,21 +728,23 @@ class HelpInterface(BaseWidget):
         title_label = ctk.CTkLabel(
             parent,
             text="💻 系统信息",
-            font=("Microsoft YaHei", 20, "bold"),
+            font=_FONT_PAGE_TITLE,
             anchor="w"
         )
         title_label.grid(row=0, column=0, sticky="w", padx=30, pady=(30, 20))
         
-        # 收集系统信息
-        system_info = self._collect_system_info()
+        # 收集系统信息：缓存有效时直接使用，否则资源信息先显示占位文本，
+        # 由后台线程采集后回填，避免阻塞 UI 线程
+        resource_future = None
+        if self._sysinfo_cache is not None and time.monotonic() - self._sysinfo_ts < _SYSTEM_INFO_TTL:
+            system_info = self._sysinfo_cache
+        else:
+            system_info = self._collect_base_info()
+            system_info["系统资源"] = dict.fromkeys(_RESOURCE_INFO_KEYS, _LOADING_TEXT)
+            resource_future = _SYSTEM_INFO_EXECUTOR.submit(self._collect_resource_info)
         
         # 显示系统信息卡片
-        info_card = Card(parent, style={
-            "fg_color": ("white", "gray20"),
-            "border_color": ("gray80", "gray40"),
-            "border_width": 1,
-            "corner_radius": 10
-        })
+        info_card = Card(parent, style=_CARD_STYLE)
         card_widget = info_card.get_widget()
         card_widget.grid(row=1, column=0, sticky="nsew", padx=30, pady=(0, 15))
         
@@ -595,38 +752,15 @@ class HelpInterface(BaseWidget):
         info_frame = ctk.CTkFrame(card_widget, fg_color="transparent")
         info_frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
         
-        # 显示系统信息
-        row = 0
-        for category, info_dict in system_info.items():
-            # 类别标题
-            category_label = ctk.CTkLabel(
-                info_frame,
-                text=category,
-                font=("Microsoft YaHei", 12, "bold"),
-                anchor="w"
-            )
-            category_label.grid(row=row, column=0, columnspan=2, sticky="w", pady=(10, 5))
-            row += 1
-            
-            # 信息项
-            for key, value in info_dict.items():
-                key_label = ctk.CTkLabel(
-                    info_frame,
-                    text=f"{key}:",
-                    font=("Microsoft YaHei", 10),
-                    anchor="w",
-                    text_color=("gray50", "gray60")
-                )
-                key_label.grid(row=row, column=0, sticky="w", padx=(20, 10), pady=2)
-                
-                value_label = ctk.CTkLabel(
-                    info_frame,
-                    text=str(value),
-                    font=("Microsoft YaHei", 10),
-                    anchor="w"
-                )
-                value_label.grid(row=row, column=1, sticky="w", pady=2)
-                row += 1
+        # 显示系统信息：只读文本合并到一个多行标签，避免每项创建两个标签
+        info_label = ctk.CTkLabel(
+            info_frame,
+            text=self._format_system_info(system_info),
+            font=_FONT_INFO,
+            anchor="w",
+            justify="left"
+        )
+        info_label.pack(fill="x")
         
         # 操作按钮
         button_frame = ctk.CTkFrame(parent, fg_color="transparent")
@@ -646,15 +780,32 @@ class HelpInterface(BaseWidget):
             button_frame,
             text="刷新",
             width=80,
-            command=lambda: self._refresh_system_info(parent)
+            command=self._refresh_system_info
         )
         refresh_button.pack(side="left")
+        
+        if resource_future is not None:
+            self._poll_resource_info(resource_future, system_info, info_label)
     
     def _collect_system_info(self) -> Dict[str, Dict[str, str]]:
-        """收集系统信息"""
-        import os
-        import psutil
+        """
+        收集系统信息（短时间内重复调用直接返回缓存）
         
+        同步版本会采样 CPU 0.1 秒，不要在 Tk 线程调用；界面通过后台线程采集。
+        """
+        now = time.monotonic()
+        if self._sysinfo_cache is not None and now - self._sysinfo_ts < _SYSTEM_INFO_TTL:
+            return self._sysinfo_cache
+        
+        info = self._collect_base_info()
+        info["系统资源"] = self._collect_resource_info()
+        
+        self._sysinfo_cache = info
+        self._sysinfo_ts = now
+        return info
+    
+    def _collect_base_info(self) -> Dict[str, Dict[str, str]]:
+        """收集不依赖 psutil 的系统信息（应用、平台、路径）"""
         info = {}
         
         # 应用信息
@@ -667,59 +818,88 @@ class HelpInterface(BaseWidget):
         
         info["应用信息"] = app_info
         
-        # Python信息
-        python_info = {
-            "Python版本": platform.python_version(),
-            "Python实现": platform.python_implementation(),
-            "Python路径": sys.executable
-        }
-        info["Python环境"] = python_info
+        # Python信息和系统信息
+        info.update(_static_platform_info())
         
-        # 系统信息
-        system_info = {
-            "操作系统": platform.system(),
-            "系统版本": platform.version(),
-            "系统架构": platform.machine(),
-            "处理器": platform.processor()
+        # 资源信息（由 _collect_resource_info 填充）
+        info["系统资源"] = {}
+        
+        # 路径信息
+        info["路径信息"] = {
+            "工作目录": os.getcwd(),
+            "Python路径": ";".join(sys.path[:3]) + "..."
         }
-        info["操作系统"] = system_info
         
-        # 资源信息
+        return info
+    
+    @staticmethod
+    def _collect_resource_info() -> Dict[str, str]:
+        """收集资源使用信息（不访问任何 Tk 对象，可在后台线程执行）"""
         resource_info = {}
+        if not PSUTIL_AVAILABLE:
+            resource_info["状态"] = "资源监控不可用（未安装 psutil）"
+            return resource_info
+        
         try:
-            if psutil:
-                # CPU信息
-                cpu_percent = psutil.cpu_percent(interval=0.1)
-                cpu_count = psutil.cpu_count()
-                resource_info["CPU使用率"] = f"{cpu_percent:.1f}%"
-                resource_info["CPU核心数"] = cpu_count
-                
-                # 内存信息
-                memory = psutil.virtual_memory()
-                memory_used_gb = memory.used / (1024**3)
-                memory_total_gb = memory.total / (1024**3)
-                resource_info["内存使用"] = f"{memory_used_gb:.1f} GB / {memory_total_gb:.1f} GB"
-                resource_info["内存使用率"] = f"{memory.percent:.1f}%"
+            # CPU信息：采样 0.1 秒。interval=None 的基准按线程记录，
+            # 工作线程上首次调用总是返回 0.0；此处已不在 Tk 线程，阻塞无妨
+            cpu_percent = psutil.cpu_percent(interval=0.1)
+            cpu_count = psutil.cpu_count()
+            resource_info["CPU使用率"] = f"{cpu_percent:.1f}%"
+            resource_info["CPU核心数"] = cpu_count
+            
+            # 内存信息
+            memory = psutil.virtual_memory()
+            memory_used_gb = memory.used / (1024**3)
+            memory_total_gb = memory.total / (1024**3)
+            resource_info["内存使用"] = f"{memory_used_gb:.1f} GB / {memory_total_gb:.1f} GB"
+            resource_info["内存使用率"] = f"{memory.percent:.1f}%"
         except Exception as e:
             logger.warning(f"获取资源信息失败: {e}")
             resource_info["状态"] = "资源监控不可用"
         
-        info["系统资源"] = resource_info
+        return resource_info
+    
+    def _poll_resource_info(
+        self,
+        future: Future,
+        system_info: Dict[str, Dict[str, str]],
+        info_label: ctk.CTkLabel
+    ) -> None:
+        """轮询后台资源信息任务，完成后在 UI 线程回填标签"""
+        if not future.done():
+            self._main_panel.get_widget().after(
+                _SYSTEM_INFO_POLL_MS, self._poll_resource_info, future, system_info, info_label
+            )
+            return
         
-        # 路径信息
-        path_info = {
-            "工作目录": os.getcwd(),
-            "Python路径": ";".join(sys.path[:3]) + "..."
-        }
-        info["路径信息"] = path_info
+        try:
+            resource_info = future.result()
+        except Exception as e:
+            logger.warning(f"获取资源信息失败: {e}")
+            resource_info = {"状态": "资源监控不可用"}
         
-        return info
+        # 原地更新，复制按钮引用的是同一个字典
+        system_info["系统资源"] = resource_info
+        self._sysinfo_cache = system_info
+        self._sysinfo_ts = time.monotonic()
+        
+        if info_label.winfo_exists():
+            info_label.configure(text=self._format_system_info(system_info))
+    
+    @staticmethod
+    def _format_system_info(system_info: Dict[str, Dict[str, str]]) -> str:
+        """将系统信息格式化为按类别分组的多行文本"""
+        blocks = []
+        for category, info_dict in system_info.items():
+            lines = [category]
+            lines.extend(f"    {key}:  {value}" for key, value in info_dict.items())
+            blocks.append("\n".join(lines))
+        return "\n\n".join(blocks)
     
     def _copy_system_info_to_clipboard(self, system_info: Dict[str, Dict[str, str]]) -> None:
         """复制系统信息到剪贴板"""
         try:
-            import tkinter as tk
-            
             # 构建文本
             lines = []
             for category, info_dict in system_info.items():
@@ -730,23 +910,27 @@ class HelpInterface(BaseWidget):
             
             text = "\n".join(lines)
             
-            # 复制到剪贴板
-            root = tk.Tk()
-            root.withdraw()
-            root.clipboard_clear()
-            root.clipboard_append(text)
-            root.update()
-            root.destroy()
+            # 复制到剪贴板（使用现有 Tk 实例，避免新建第二个根窗口）
+            widget = self._main_panel.get_widget()
+            widget.clipboard_clear()
+            widget.clipboard_append(text)
+            widget.update_idletasks()
             
             logger.info("系统信息已复制到剪贴板")
             
         except Exception as e:
             logger.error(f"复制系统信息失败: {e}")
     
-    def _refresh_system_info(self, parent) -> None:
+    def _refresh_system_info(self) -> None:
         """刷新系统信息视图"""
         logger.debug("刷新系统信息视图")
-        self._load_system_info_view(parent)
+        # 只有系统信息页面需要失效重建
+        page_frame = self._view_frames.pop(HelpViewType.SYSTEM_INFO, None)
+        if page_frame is not None:
+            if page_frame is self._page_frame:
+                self._page_frame = None
+            page_frame.destroy()
+        self._load_view(HelpViewType.SYSTEM_INFO)
     
     def _load_about_view(self, parent) -> None:
         """加载关于页面视图"""
@@ -754,18 +938,13 @@ class HelpInterface(BaseWidget):
         title_label = ctk.CTkLabel(
             parent,
             text="ℹ️ 关于小盘古",
-            font=("Microsoft YaHei", 20, "bold"),
+            font=_FONT_PAGE_TITLE,
             anchor="w"
         )
         title_label.grid(row=0, column=0, sticky="w", padx=30, pady=(30, 20))
         
         # 关于卡片
-        about_card = Card(parent, style={
-            "fg_color": ("white", "gray20"),
-            "border_color": ("gray80", "gray40"),
-            "border_width": 1,
-            "corner_radius": 10
-        })
+        about_card = Card(parent, style=_CARD_STYLE)
         card_widget = about_card.get_widget()
         card_widget.grid(row=1, column=0, sticky="nsew", padx=30, pady=(0, 15))
         
@@ -815,7 +994,7 @@ class HelpInterface(BaseWidget):
         description_label = ctk.CTkLabel(
             about_frame,
             text=description_text,
-            font=("Microsoft YaHei", 11),
+            font=_FONT_BODY,
             anchor="w",
             justify="left",
             wraplength=500
@@ -833,7 +1012,7 @@ class HelpInterface(BaseWidget):
             width=120,
             fg_color=("gray80", "gray30"),
             hover_color=("gray70", "gray40"),
-            command=lambda: webbrowser.open("https://github.com/smallpangu")
+            command=partial(self._open_link, "project")
         )
         project_button.pack(side="left", padx=(0, 10))
         
@@ -844,7 +1023,7 @@ class HelpInterface(BaseWidget):
             width=120,
             fg_color=("gray80", "gray30"),
             hover_color=("gray70", "gray40"),
-            command=lambda: webbrowser.open("https://smallpangu.github.io/docs")
+            command=partial(self._open_link, "docs")
         )
         docs_button.pack(side="left", padx=(0, 10))
         
@@ -855,7 +1034,7 @@ class HelpInterface(BaseWidget):
             width=120,
             fg_color=("gray80", "gray30"),
             hover_color=("gray70", "gray40"),
-            command=lambda: webbrowser.open("https://github.com/smallpangu/issues")
+            command=partial(self._open_link, "feedback")
         )
         feedback_button.pack(side="left")
         
@@ -872,6 +1051,10 @@ class HelpInterface(BaseWidget):
         )
         license_label.pack()
     
+    def _open_link(self, key: str) -> None:
+        """在浏览器中打开外部链接"""
+        webbrowser.open(self._LINKS[key])
+    
     def switch_view(self, view_type: HelpViewType) -> bool:
         """
         切换帮助视图
@@ -882,10 +1065,15 @@ class HelpInterface(BaseWidget):
         Returns:
             是否成功切换
         """
+        # 已经显示该视图时无需重新布局
+        if view_type is self._view_type and self._page_frame is not None:
+            return True
+        
         logger.debug_struct("切换帮助视图", view_type=view_type.value)
         
         try:
             self._view_type = view_type
+            self._state_epoch += 1
             self._load_view(view_type)
             
             # 发布视图切换事件
@@ -906,12 +1094,17 @@ class HelpInterface(BaseWidget):
         """获取当前视图类型"""
         return self._view_type
     
+    def get_state_epoch(self) -> int:
+        """获取状态版本号（每次切换视图后递增）"""
+        return self._state_epoch
+    
     def get_status(self) -> Dict[str, Any]:
         """获取帮助界面状态"""
         return {
             "widget_id": self._widget_id,
             "view_type": self._view_type.value,
-            "help_section_count": sum(len(sections) for sections in self._help_sections.values())
+            "help_section_count": sum(len(sections) for sections in _STATIC_HELP_DATA.values()),
+            "loaded_view_count": len(self._help_sections)
         }
 
 
@@ -922,6 +1115,32 @@ class HelpView:
     集成帮助界面到主窗口视图框架中
     """
     
+    __slots__ = (
+        "_parent",
+        "_config_manager",
+        "_event_bus",
+        "_container",
+        "_main_frame",
+        "_help_interface",
+        "_status_cache",
+        "_status_epoch_seen",
+        "_pending_view",
+        "_flush_pending"
+    )
+    
+    # help.request 事件主题 -> 帮助视图
+    _TOPIC_TO_VIEW: Dict[str, HelpViewType] = {
+        "getting_started": HelpViewType.GETTING_STARTED,
+        "shortcuts": HelpViewType.SHORTCUTS,
+        "faq": HelpViewType.FAQ,
+        "system_info": HelpViewType.SYSTEM_INFO
+    }
+    
+    # 主题子频道（help.request.<topic>）-> 帮助视图
+    _CHANNEL_TO_VIEW: Dict[str, HelpViewType] = {
+        f"help.request.{topic}": view_type for topic, view_type in _TOPIC_TO_VIEW.items()
+    }
+    
     def __init__(
         self,
         parent,
@@ -947,6 +1166,14 @@ class HelpView:
         self._main_frame = None
         self._help_interface = None
         
+        # 状态缓存（按帮助界面状态版本号失效）
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_epoch_seen = -1
+        
+        # 待处理的帮助请求（同一帧内只处理最后一个）
+        self._pending_view: Optional[HelpViewType] = None
+        self._flush_pending: Optional[str] = None
+        
         # 初始化
         self._initialize()
         
@@ -987,25 +1214,48 @@ class HelpView:
     
     def _subscribe_events(self) -> None:
         """订阅事件"""
-        # 帮助请求事件
+        # 帮助请求事件：按主题子频道路由，无需解析事件数据
+        self._event_bus.subscribe("help.request.*", self._on_help_topic_request)
+        # 兼容在事件数据中携带主题的旧格式
         self._event_bus.subscribe("help.request", self._on_help_request)
     
+    def _on_help_topic_request(self, event) -> None:
+        """处理主题子频道上的帮助请求"""
+        view_type = self._CHANNEL_TO_VIEW.get(event.type)
+        if view_type is not None:
+            self._request_view(view_type)
+    
     def _on_help_request(self, event) -> None:
         """处理帮助请求"""
         data = event.data
-        topic = data.get("topic")
+        # 兼容旧的字典格式事件数据
+        topic = data.get("topic") if isinstance(data, dict) else getattr(data, "topic", None)
         
-        logger.debug_struct("帮助请求", topic=topic)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug_struct("帮助请求", topic=topic)
         
         # 根据主题切换到相应视图
-        if topic == "getting_started":
-            self._help_interface.switch_view(HelpViewType.GETTING_STARTED)
-        elif topic == "shortcuts":
-            self._help_interface.switch_view(HelpViewType.SHORTCUTS)
-        elif topic == "faq":
-            self._help_interface.switch_view(HelpViewType.FAQ)
-        elif topic == "system_info":
-            self._help_interface.switch_view(HelpViewType.SYSTEM_INFO)
+        view_type = self._TOPIC_TO_VIEW.get(topic)
+        if view_type is not None:
+            self._request_view(view_type)
+    
+    def _request_view(self, view_type: HelpViewType) -> None:
+        """请求切换视图，短时间内的多次请求只切换到最后一个"""
+        # 界面未创建成功时忽略请求
+        if self._help_interface is None:
+            return
+        
+        self._pending_view = view_type
+        if self._flush_pending is None:
+            self._flush_pending = self._main_frame.after(_HELP_REQUEST_COALESCE_MS, self._flush_help_request)
+    
+    def _flush_help_request(self) -> None:
+        """执行合并后的帮助请求"""
+        view_type = self._pending_view
+        self._pending_view = None
+        self._flush_pending = None
+        if view_type is not None and self._help_interface:
+            self._help_interface.switch_view(view_type)
     
     def get_widget(self):
         """获取主框架"""
@@ -1016,16 +1266,27 @@ class HelpView:
         return self._help_interface
     
     def get_status(self) -> Dict[str, Any]:
-        """获取帮助视图状态"""
-        if self._help_interface:
-            return self._help_interface.get_status()
-        return {"initialized": False}
+        """
+        获取帮助视图状态
+        
+        状态未变化时返回同一个缓存字典，调用方如需修改请先复制。
+        """
+        help_interface = self._help_interface
+        if help_interface is None:
+            return _UNINIT_STATUS
+        
+        epoch = help_interface.get_state_epoch()
+        if epoch != self._status_epoch_seen:
+            self._status_cache = help_interface.get_status()
+            self._status_epoch_seen = epoch
+        return self._status_cache
 
 
 # 导出
 __all__ = [
     "HelpViewType",
     "HelpSection",
+    "HelpRequestData",
     "HelpCard",
     "HelpInterface",
     "HelpView"
@@ -7,7 +7,9 @@
 
 import json
 import logging
-from typing import Dict, Any, Optional, List, Callable, Union
+import sys
+from collections import Counter, OrderedDict
+from typing import Dict, Any, Optional, List, Callable, Union, Tuple
 from pathlib import Path
 from enum import Enum
 from dataclasses import dataclass
@@ -21,6 +23,15 @@ from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 翻译键：(文本域, 上下文, 键名)
+TranslationKey = Tuple[str, Optional[str], str]
+
+# 共享的空翻译表，语言不存在时用于链式 get
+_EMPTY: Dict[TranslationKey, Any] = {}
+
+# translate() 结果缓存的最大条目数（防止动态键导致无限增长）
+_TRANSLATE_CACHE_SIZE = 4096
+
 
 class Language(str, Enum):
     """语言枚举（与配置模型保持一致）"""
@@ -38,6 +49,103 @@ class TextDomain(str, Enum):
     COMMON = "common"  # 通用文本
 
 
+# 内置中文翻译（纯文本条目直接存字符串，不构造 Translation）
+_BUILTIN_ZH_CN: Dict[TranslationKey, str] = {
+    # UI文本域
+    (TextDomain.UI.value, None, "app.title"): "小盘古 AI 助手",
+    (TextDomain.UI.value, None, "sidebar.chat"): "聊天",
+    (TextDomain.UI.value, None, "sidebar.plugins"): "插件",
+    (TextDomain.UI.value, None, "sidebar.config"): "配置",
+    (TextDomain.UI.value, None, "sidebar.monitor"): "监控",
+    (TextDomain.UI.value, None, "sidebar.help"): "帮助",
+    (TextDomain.UI.value, None, "sidebar.settings"): "设置",
+    (TextDomain.UI.value, None, "status.ready"): "就绪",
+    (TextDomain.UI.value, None, "button.send"): "发送",
+    (TextDomain.UI.value, None, "button.cancel"): "取消",
+    (TextDomain.UI.value, None, "button.save"): "保存",
+    (TextDomain.UI.value, None, "button.reset"): "重置",
+    (TextDomain.UI.value, None, "label.username"): "用户名",
+    (TextDomain.UI.value, None, "label.password"): "密码",
+    (TextDomain.UI.value, None, "label.api_key"): "API密钥",
+    (TextDomain.UI.value, None, "placeholder.input_message"): "输入消息...",
+    (TextDomain.UI.value, None, "placeholder.search"): "搜索...",
+
+    # 错误文本域
+    (TextDomain.ERROR.value, None, "error.network"): "网络连接失败",
+    (TextDomain.ERROR.value, None, "error.auth"): "认证失败",
+    (TextDomain.ERROR.value, None, "error.permission"): "权限不足",
+    (TextDomain.ERROR.value, None, "error.not_found"): "未找到",
+    (TextDomain.ERROR.value, None, "error.timeout"): "请求超时",
+    (TextDomain.ERROR.value, None, "error.unknown"): "未知错误",
+
+    # 系统文本域
+    (TextDomain.SYSTEM.value, None, "system.starting"): "系统启动中...",
+    (TextDomain.SYSTEM.value, None, "system.stopping"): "系统关闭中...",
+    (TextDomain.SYSTEM.value, None, "system.initialized"): "系统初始化完成",
+    (TextDomain.SYSTEM.value, None, "system.plugin_loaded"): "插件加载完成",
+
+    # 通用文本域
+    (TextDomain.COMMON.value, None, "common.yes"): "是",
+    (TextDomain.COMMON.value, None, "common.no"): "否",
+    (TextDomain.COMMON.value, None, "common.ok"): "确定",
+    (TextDomain.COMMON.value, None, "common.close"): "关闭",
+    (TextDomain.COMMON.value, None, "common.back"): "返回",
+    (TextDomain.COMMON.value, None, "common.next"): "下一步",
+    (TextDomain.COMMON.value, None, "common.previous"): "上一步",
+    (TextDomain.COMMON.value, None, "common.loading"): "加载中...",
+    (TextDomain.COMMON.value, None, "common.success"): "成功",
+    (TextDomain.COMMON.value, None, "common.failed"): "失败"
+}
+
+# 内置英文翻译
+_BUILTIN_EN_US: Dict[TranslationKey, str] = {
+    # UI domain
+    (TextDomain.UI.value, None, "app.title"): "SmallPangu AI Assistant",
+    (TextDomain.UI.value, None, "sidebar.chat"): "Chat",
+    (TextDomain.UI.value, None, "sidebar.plugins"): "Plugins",
+    (TextDomain.UI.value, None, "sidebar.config"): "Config",
+    (TextDomain.UI.value, None, "sidebar.monitor"): "Monitor",
+    (TextDomain.UI.value, None, "sidebar.help"): "Help",
+    (TextDomain.UI.value, None, "sidebar.settings"): "Settings",
+    (TextDomain.UI.value, None, "status.ready"): "Ready",
+    (TextDomain.UI.value, None, "button.send"): "Send",
+    (TextDomain.UI.value, None, "button.cancel"): "Cancel",
+    (TextDomain.UI.value, None, "button.save"): "Save",
+    (TextDomain.UI.value, None, "button.reset"): "Reset",
+    (TextDomain.UI.value, None, "label.username"): "Username",
+    (TextDomain.UI.value, None, "label.password"): "Password",
+    (TextDomain.UI.value, None, "label.api_key"): "API Key",
+    (TextDomain.UI.value, None, "placeholder.input_message"): "Type a message...",
+    (TextDomain.UI.value, None, "placeholder.search"): "Search...",
+
+    # Error domain
+    (TextDomain.ERROR.value, None, "error.network"): "Network connection failed",
+    (TextDomain.ERROR.value, None, "error.auth"): "Authentication failed",
+    (TextDomain.ERROR.value, None, "error.permission"): "Insufficient permissions",
+    (TextDomain.ERROR.value, None, "error.not_found"): "Not found",
+    (TextDomain.ERROR.value, None, "error.timeout"): "Request timeout",
+    (TextDomain.ERROR.value, None, "error.unknown"): "Unknown error",
+
+    # System domain
+    (TextDomain.SYSTEM.value, None, "system.starting"): "System starting...",
+    (TextDomain.SYSTEM.value, None, "system.stopping"): "System stopping...",
+    (TextDomain.SYSTEM.value, None, "system.initialized"): "System initialized",
+    (TextDomain.SYSTEM.value, None, "system.plugin_loaded"): "Plugin loaded",
+
+    # Common domain
+    (TextDomain.COMMON.value, None, "common.yes"): "Yes",
+    (TextDomain.COMMON.value, None, "common.no"): "No",
+    (TextDomain.COMMON.value, None, "common.ok"): "OK",
+    (TextDomain.COMMON.value, None, "common.close"): "Close",
+    (TextDomain.COMMON.value, None, "common.back"): "Back",
+    (TextDomain.COMMON.value, None, "common.next"): "Next",
+    (TextDomain.COMMON.value, None, "common.previous"): "Previous",
+    (TextDomain.COMMON.value, None, "common.loading"): "Loading...",
+    (TextDomain.COMMON.value, None, "common.success"): "Success",
+    (TextDomain.COMMON.value, None, "common.failed"): "Failed"
+}
+
+
 @dataclass
 class Translation:
     """翻译数据类"""
@@ -85,8 +193,12 @@ class I18nManager:
         self._fallback_language = Language.EN_US
         
         # 翻译数据存储
-        self._translations: Dict[str, Dict[str, Translation]] = {}  # language -> {key: translation}
-        self._text_domains: Dict[TextDomain, Dict[str, Dict[str, Translation]]] = {}  # domain -> {language: {key: translation}}
+        # 翻译键已包含文本域前缀，单层表即可唯一定位
+        # 纯文本条目直接存字符串，带复数/上下文等信息的条目存 Translation
+        self._translations: Dict[str, Dict[TranslationKey, Union[Translation, str]]] = {}  # language -> {key: translation}
+        
+        # translate() 结果的LRU缓存，翻译数据或语言变化时清空
+        self._trans_cache: "OrderedDict[tuple, str]" = OrderedDict()
         
         # 语言监听器（用于实时更新UI文本）
         self._language_listeners: List[Callable] = []
@@ -142,11 +254,6 @@ class I18nManager:
         """加载内置翻译"""
         logger.debug("加载内置翻译")
         
-        # 初始化各文本域的存储结构
-        for domain in TextDomain:
-            if domain not in self._text_domains:
-                self._text_domains[domain] = {}
-        
         # 加载内置中文翻译
         self._load_builtin_language(Language.ZH_CN)
         
@@ -167,113 +274,19 @@ class I18nManager:
         elif language == Language.EN_US:
             translations = self._get_builtin_en_us_translations()
         else:
-            translations = []
+            translations = {}
         
-        # 存储翻译
-        self._translations[language.value] = {}
-        for domain in TextDomain:
-            self._text_domains[domain][language.value] = {}
-        
-        for trans in translations:
-            self._add_translation(trans, language)
+        # 存储翻译（内置条目均为纯文本，整体写入）
+        self._translations[language.value] = dict(translations)
+        self._trans_cache.clear()
     
-    def _get_builtin_zh_cn_translations(self) -> List[Translation]:
+    def _get_builtin_zh_cn_translations(self) -> Dict[TranslationKey, str]:
         """获取内置中文翻译"""
-        return [
-            # UI文本域
-            Translation(key="app.title", text="小盘古 AI 助手", domain=TextDomain.UI),
-            Translation(key="sidebar.chat", text="聊天", domain=TextDomain.UI),
-            Translation(key="sidebar.plugins", text="插件", domain=TextDomain.UI),
-            Translation(key="sidebar.config", text="配置", domain=TextDomain.UI),
-            Translation(key="sidebar.monitor", text="监控", domain=TextDomain.UI),
-            Translation(key="sidebar.help", text="帮助", domain=TextDomain.UI),
-            Translation(key="sidebar.settings", text="设置", domain=TextDomain.UI),
-            Translation(key="status.ready", text="就绪", domain=TextDomain.UI),
-            Translation(key="button.send", text="发送", domain=TextDomain.UI),
-            Translation(key="button.cancel", text="取消", domain=TextDomain.UI),
-            Translation(key="button.save", text="保存", domain=TextDomain.UI),
-            Translation(key="button.reset", text="重置", domain=TextDomain.UI),
-            Translation(key="label.username", text="用户名", domain=TextDomain.UI),
-            Translation(key="label.password", text="密码", domain=TextDomain.UI),
-            Translation(key="label.api_key", text="API密钥", domain=TextDomain.UI),
-            Translation(key="placeholder.input_message", text="输入消息...", domain=TextDomain.UI),
-            Translation(key="placeholder.search", text="搜索...", domain=TextDomain.UI),
-            
-            # 错误文本域
-            Translation(key="error.network", text="网络连接失败", domain=TextDomain.ERROR),
-            Translation(key="error.auth", text="认证失败", domain=TextDomain.ERROR),
-            Translation(key="error.permission", text="权限不足", domain=TextDomain.ERROR),
-            Translation(key="error.not_found", text="未找到", domain=TextDomain.ERROR),
-            Translation(key="error.timeout", text="请求超时", domain=TextDomain.ERROR),
-            Translation(key="error.unknown", text="未知错误", domain=TextDomain.ERROR),
-            
-            # 系统文本域
-            Translation(key="system.starting", text="系统启动中...", domain=TextDomain.SYSTEM),
-            Translation(key="system.stopping", text="系统关闭中...", domain=TextDomain.SYSTEM),
-            Translation(key="system.initialized", text="系统初始化完成", domain=TextDomain.SYSTEM),
-            Translation(key="system.plugin_loaded", text="插件加载完成", domain=TextDomain.SYSTEM),
-            
-            # 通用文本域
-            Translation(key="common.yes", text="是", domain=TextDomain.COMMON),
-            Translation(key="common.no", text="否", domain=TextDomain.COMMON),
-            Translation(key="common.ok", text="确定", domain=TextDomain.COMMON),
-            Translation(key="common.close", text="关闭", domain=TextDomain.COMMON),
-            Translation(key="common.back", text="返回", domain=TextDomain.COMMON),
-            Translation(key="common.next", text="下一步", domain=TextDomain.COMMON),
-            Translation(key="common.previous", text="上一步", domain=TextDomain.COMMON),
-            Translation(key="common.loading", text="加载中...", domain=TextDomain.COMMON),
-            Translation(key="common.success", text="成功", domain=TextDomain.COMMON),
-            Translation(key="common.failed", text="失败", domain=TextDomain.COMMON),
-        ]
-    
-    def _get_builtin_en_us_translations(self) -> List[Translation]:
+        return _BUILTIN_ZH_CN
+    
+    def _get_builtin_en_us_translations(self) -> Dict[TranslationKey, str]:
         """获取内置英文翻译"""
-        return [
-            # UI domain
-            Translation(key="app.title", text="SmallPangu AI Assistant", domain=TextDomain.UI),
-            Translation(key="sidebar.chat", text="Chat", domain=TextDomain.UI),
-            Translation(key="sidebar.plugins", text="Plugins", domain=TextDomain.UI),
-            Translation(key="sidebar.config", text="Config", domain=TextDomain.UI),
-            Translation(key="sidebar.monitor", text="Monitor", domain=TextDomain.UI),
-            Translation(key="sidebar.help", text="Help", domain=TextDomain.UI),
-            Translation(key="sidebar.settings", text="Settings", domain=TextDomain.UI),
-            Translation(key="status.ready", text="Ready", domain=TextDomain.UI),
-            Translation(key="button.send", text="Send", domain=TextDomain.UI),
-            Translation(key="button.cancel", text="Cancel", domain=TextDomain.UI),
-            Translation(key="button.save", text="Save", domain=TextDomain.UI),
-            Translation(key="button.reset", text="Reset", domain=TextDomain.UI),
-            Translation(key="label.username", text="Username", domain=TextDomain.UI),
-            Translation(key="label.password", text="Password", domain=TextDomain.UI),
-            Translation(key="label.api_key", text="API Key", domain=TextDomain.UI),
-            Translation(key="placeholder.input_message", text="Type a message...", domain=TextDomain.UI),
-            Translation(key="placeholder.search", text="Search...", domain=TextDomain.UI),
-            
-            # Error domain
-            Translation(key="error.network", text="Network connection failed", domain=TextDomain.ERROR),
-            Translation(key="error.auth", text="Authentication failed", domain=TextDomain.ERROR),
-            Translation(key="error.permission", text="Insufficient permissions", domain=TextDomain.ERROR),
-            Translation(key="error.not_found", text="Not found", domain=TextDomain.ERROR),
-            Translation(key="error.timeout", text="Request timeout", domain=TextDomain.ERROR),
-            Translation(key="error.unknown", text="Unknown error", domain=TextDomain.ERROR),
-            
-            # System domain
-            Translation(key="system.starting", text="System starting...", domain=TextDomain.SYSTEM),
-            Translation(key="system.stopping", text="System stopping...", domain=TextDomain.SYSTEM),
-            Translation(key="system.initialized", text="System initialized", domain=TextDomain.SYSTEM),
-            Translation(key="system.plugin_loaded", text="Plugin loaded", domain=TextDomain.SYSTEM),
-            
-            # Common domain
-            Translation(key="common.yes", text="Yes", domain=TextDomain.COMMON),
-            Translation(key="common.no", text="No", domain=TextDomain.COMMON),
-            Translation(key="common.ok", text="OK", domain=TextDomain.COMMON),
-            Translation(key="common.close", text="Close", domain=TextDomain.COMMON),
-            Translation(key="common.back", text="Back", domain=TextDomain.COMMON),
-            Translation(key="common.next", text="Next", domain=TextDomain.COMMON),
-            Translation(key="common.previous", text="Previous", domain=TextDomain.COMMON),
-            Translation(key="common.loading", text="Loading...", domain=TextDomain.COMMON),
-            Translation(key="common.success", text="Success", domain=TextDomain.COMMON),
-            Translation(key="common.failed", text="Failed", domain=TextDomain.COMMON),
-        ]
+        return _BUILTIN_EN_US
     
     def _add_translation(self, translation: Translation, language: Language) -> None:
         """
@@ -283,21 +296,18 @@ class I18nManager:
             translation: 翻译对象
             language: 语言
         """
-        # 存储到全局翻译表
         lang_key = language.value
-        trans_key = self._make_translation_key(translation.domain, translation.key, translation.context)
-        self._translations[lang_key][trans_key] = translation
-        
-        # 存储到文本域翻译表
-        if translation.domain not in self._text_domains:
-            self._text_domains[translation.domain] = {}
         
-        if lang_key not in self._text_domains[translation.domain]:
-            self._text_domains[translation.domain][lang_key] = {}
+        # 驻留键名和上下文：从文件加载的字符串是新对象，驻留后查询时可按身份快速比较
+        translation.key = sys.intern(translation.key)
+        if translation.context:
+            translation.context = sys.intern(translation.context)
         
-        self._text_domains[translation.domain][lang_key][trans_key] = translation
+        trans_key = self._make_translation_key(translation.domain, translation.key, translation.context)
+        self._translations.setdefault(lang_key, {})[trans_key] = translation
+        self._trans_cache.clear()
     
-    def _make_translation_key(self, domain: TextDomain, key: str, context: Optional[str] = None) -> str:
+    def _make_translation_key(self, domain: TextDomain, key: str, context: Optional[str] = None) -> TranslationKey:
         """
         创建翻译键
         
@@ -309,9 +319,8 @@ class I18nManager:
         Returns:
             翻译键
         """
-        if context:
-            return f"{domain.value}:{context}:{key}"
-        return f"{domain.value}:{key}"
+        # 元组键避免每次查询拼接字符串
+        return (domain.value, context or None, key)
     
     def _load_language_files(self) -> None:
         """加载语言包文件"""
@@ -399,6 +408,62 @@ class I18nManager:
                                 logger.debug_struct("Gettext翻译加载", language=lang_code)
                         except Exception as e:
                             logger.warning_struct("Gettext翻译加载失败", language=lang_code, error=str(e))
+                    
+                    # 按文本域编译的目录（LC_MESSAGES/<domain>.mo）
+                    for domain in TextDomain:
+                        domain_mo = lang_dir / "LC_MESSAGES" / f"{domain.value}.mo"
+                        if domain_mo.exists():
+                            try:
+                                self._load_gettext_catalog(domain_mo, domain, lang_code)
+                            except Exception as e:
+                                logger.warning_struct("Gettext文本域加载失败", file=str(domain_mo), error=str(e))
+    
+    def _load_gettext_catalog(self, mo_file: Path, domain: TextDomain, language_code: str) -> None:
+        """
+        将编译后的Gettext目录一次性导入翻译表
+        
+        .mo 为二进制格式，解析远快于 JSON/.po；导入后查询与其他来源的翻译走同一张表。
+        
+        Args:
+            mo_file: .mo 文件路径
+            domain: 文本域
+            language_code: 语言代码（目录名，如 zh_CN）
+        """
+        language = Language(language_code.replace("_", "-"))
+        
+        with open(mo_file, 'rb') as f:
+            catalog = gettext.GNUTranslations(f)._catalog
+        
+        texts: Dict[Tuple[Optional[str], str], str] = {}
+        plurals: Dict[Tuple[Optional[str], str], Dict[int, str]] = {}
+        for msg_key, text in catalog.items():
+            # 复数条目的键为 (msgid, 序号)
+            msgid, plural_index = msg_key if isinstance(msg_key, tuple) else (msg_key, None)
+            if not msgid or not text:
+                # 空 msgid 为目录头信息
+                continue
+            
+            # 带上下文的 msgid 编码为 "context\x04msgid"
+            context, _, key = msgid.rpartition("\x04")
+            entry_key = (context or None, key)
+            
+            if plural_index is None:
+                texts[entry_key] = text
+            else:
+                plurals.setdefault(entry_key, {})[plural_index] = text
+        
+        for (context, key), forms in plurals.items():
+            plural_texts = [forms[i] for i in sorted(forms)]
+            text = texts.pop((context, key), plural_texts[0])
+            self._add_translation(
+                Translation(key=key, text=text, domain=domain, context=context, plural_texts=plural_texts),
+                language
+            )
+        
+        for (context, key), text in texts.items():
+            self._add_translation(Translation(key=key, text=text, domain=domain, context=context), language)
+        
+        logger.debug_struct("Gettext文本域加载完成", file=str(mo_file), translation_count=len(catalog))
     
     def _subscribe_events(self) -> None:
         """订阅语言相关事件"""
@@ -477,6 +542,7 @@ class I18nManager:
             # 更新当前语言
             old_language = self._current_language
             self._current_language = language
+            self._trans_cache.clear()
             
             # 更新配置
             self._ui_config.language = language.value
@@ -532,17 +598,31 @@ class I18nManager:
         Returns:
             翻译文本，如果未找到则返回键本身
         """
-        # 尝试获取当前语言的翻译
-        trans_key = self._make_translation_key(domain, key, context)
-        translation = self._get_translation(trans_key, self._current_language)
+        # 热路径：属性先绑定到局部变量
+        language = self._current_language
+        cache = self._trans_cache
+        
+        # 先查结果缓存：只缓存无格式化参数的调用。参数按相等性比较会把
+        # 1、1.0、True 视为同一个键，且对象的格式化结果可能随时间变化
+        cache_key = None if kwargs else (language, domain, key, context)
+        if cache_key is not None:
+            text = cache.get(cache_key)
+            if text is not None:
+                cache.move_to_end(cache_key)
+                return text
+        
+        # 尝试获取当前语言的翻译（内联 _make_translation_key/_get_translation）
+        table = self._translations
+        trans_key = (domain.value, context or None, key)
+        translation = table.get(language.value, _EMPTY).get(trans_key)
         
         if translation:
-            text = translation.text
+            text = translation if type(translation) is str else translation.text
         else:
             # 回退到备用语言
-            translation = self._get_translation(trans_key, self._fallback_language)
+            translation = table.get(self._fallback_language.value, _EMPTY).get(trans_key)
             if translation:
-                text = translation.text
+                text = translation if type(translation) is str else translation.text
             else:
                 # 都未找到，返回键本身
                 logger.debug_struct("翻译未找到", key=key, domain=domain, context=context)
@@ -555,6 +635,11 @@ class I18nManager:
             except (KeyError, ValueError) as e:
                 logger.warning_struct("文本格式化失败", text=text, kwargs=kwargs, error=str(e))
         
+        if cache_key is not None:
+            cache[cache_key] = text
+            if len(cache) > _TRANSLATE_CACHE_SIZE:
+                cache.popitem(last=False)
+        
         return text
     
     def translate_plural(self, key: str, count: int, domain: TextDomain = TextDomain.COMMON,
@@ -576,7 +661,7 @@ class I18nManager:
         trans_key = self._make_translation_key(domain, key, context)
         translation = self._get_translation(trans_key, self._current_language)
         
-        if translation and translation.plural_texts:
+        if isinstance(translation, Translation) and translation.plural_texts:
             # 根据数量选择复数形式
             # 这里使用简单的规则：中文通常没有复数形式，英文根据count选择
             if self._current_language == Language.EN_US:
@@ -606,7 +691,7 @@ class I18nManager:
         
         return text
     
-    def _get_translation(self, trans_key: str, language: Language) -> Optional[Translation]:
+    def _get_translation(self, trans_key: TranslationKey, language: Language) -> Optional[Union[Translation, str]]:
         """
         获取翻译
         
@@ -615,22 +700,9 @@ class I18nManager:
             language: 语言
             
         Returns:
-            翻译对象，如果未找到则返回None
+            翻译对象或纯文本，如果未找到则返回None
         """
-        lang_key = language.value
-        
-        # 首先在全局翻译表中查找
-        if lang_key in self._translations and trans_key in self._translations[lang_key]:
-            return self._translations[lang_key][trans_key]
-        
-        # 然后在文本域翻译表中查找
-        for domain in TextDomain:
-            if (domain.value in self._text_domains and 
-                lang_key in self._text_domains[domain.value] and
-                trans_key in self._text_domains[domain.value][lang_key]):
-                return self._text_domains[domain.value][lang_key][trans_key]
-        
-        return None
+        return self._translations.get(language.value, _EMPTY).get(trans_key)
     
     def update_translations(self, translations: List[Translation], 
                            domain: TextDomain, language: Language) -> None:
@@ -651,6 +723,8 @@ class I18nManager:
             
             self._add_translation(translation, language)
         
+        self._trans_cache.clear()
+        
         # 如果更新的是当前语言，通知监听器
         if language == self._current_language:
             self._notify_language_listeners()
@@ -725,16 +799,12 @@ class I18nManager:
         """
         lang_key = language.value
         
-        # 统计翻译数量
-        translation_count = 0
-        if lang_key in self._translations:
-            translation_count = len(self._translations[lang_key])
+        # 统计翻译数量（诊断接口，按需从翻译表计算）
+        translations = self._translations.get(lang_key, _EMPTY)
+        translation_count = len(translations)
         
-        domain_counts = {}
-        for domain in TextDomain:
-            if (domain.value in self._text_domains and 
-                lang_key in self._text_domains[domain.value]):
-                domain_counts[domain.value] = len(self._text_domains[domain.value][lang_key])
+        counts = Counter(domain for domain, _context, _key in translations)
+        domain_counts = {domain.value: counts[domain.value] for domain in TextDomain}
         
         return {
             "code": language.value,
@@ -769,7 +839,7 @@ class I18nManager:
         
         # 清理翻译数据
         self._translations.clear()
-        self._text_domains.clear()
+        self._trans_cache.clear()
         self._gettext_translations.clear()
         
         logger.debug("国际化管理器已关闭")
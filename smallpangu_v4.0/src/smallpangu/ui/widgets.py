@@ -7,6 +7,7 @@ UI组件库
 
 import customtkinter as ctk
 import logging
+import sys
 from typing import Dict, Any, Optional, List, Union, Callable, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
@@ -18,6 +19,9 @@ from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Python 3.10+ 的dataclass支持slots，低版本退化为普通dataclass；各界面模块共用此参数
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class WidgetState(str, Enum):
     """组件状态枚举"""
@@ -587,6 +591,7 @@ class ScrollPanel(BaseWidget):
         self._scrollbar_width = scrollbar_width
         self._kwargs = kwargs
         self._content_frame = None
+        self._scroll_listeners: List[Callable[[], None]] = []
         self.initialize()
     
     def create_widget(self) -> ctk.CTkBaseClass:
@@ -596,12 +601,65 @@ class ScrollPanel(BaseWidget):
         
         scroll_frame = ctk.CTkScrollableFrame(self._parent, **config)
         scroll_frame._scrollbar.configure(width=self._scrollbar_width)
+        self._install_scroll_hook(scroll_frame)
         
         # 保存内容框架引用
         self._content_frame = scroll_frame
         
         return scroll_frame
     
+    def _install_scroll_hook(self, scroll_frame: ctk.CTkScrollableFrame) -> None:
+        """接管画布的yscrollcommand：先更新滚动条，再通知滚动监听器"""
+        canvas = getattr(scroll_frame, "_parent_canvas", None)
+        scrollbar = getattr(scroll_frame, "_scrollbar", None)
+        if canvas is None or scrollbar is None:
+            return
+        
+        scrollbar_set = scrollbar.set
+        
+        def on_yscroll(first, last) -> None:
+            scrollbar_set(first, last)
+            for callback in tuple(self._scroll_listeners):
+                callback()
+        
+        canvas.configure(yscrollcommand=on_yscroll)
+    
+    def add_scroll_listener(self, callback: Callable[[], None]) -> None:
+        """
+        注册滚动监听器，在面板滚动或可视区域尺寸变化时调用
+        
+        Args:
+            callback: 无参回调函数
+        """
+        if callback not in self._scroll_listeners:
+            self._scroll_listeners.append(callback)
+    
+    def remove_scroll_listener(self, callback: Callable[[], None]) -> None:
+        """注销滚动监听器"""
+        if callback in self._scroll_listeners:
+            self._scroll_listeners.remove(callback)
+    
+    def is_in_viewport(self, widget: Optional[ctk.CTkBaseClass]) -> bool:
+        """
+        判断组件是否与滚动面板的可视区域相交
+        
+        无法获取可视区域时视为可见，调用方据此退化为全部渲染。
+        
+        Args:
+            widget: 滚动面板内容中的Tkinter组件
+        """
+        if widget is None:
+            return False
+        
+        canvas = getattr(self._widget, "_parent_canvas", None)
+        if canvas is None:
+            return True
+        
+        viewport_top = canvas.winfo_rooty()
+        viewport_bottom = viewport_top + canvas.winfo_height()
+        top = widget.winfo_rooty()
+        return top <= viewport_bottom and top + widget.winfo_height() >= viewport_top
+    
     def get_content_frame(self) -> Optional[ctk.CTkBaseClass]:
         """获取内容框架（用于添加子组件）"""
         return self._content_frame
@@ -983,6 +1041,12 @@ class Dropdown(BaseWidget):
         if self._widget and value in self._options:
             self._widget.set(value)
     
+    def set_command(self, command: Optional[Callable[[str], None]]) -> None:
+        """设置选项变更回调（从下拉列表选中某项时以选中值调用）"""
+        self._kwargs["command"] = command
+        if self._widget:
+            self._widget.configure(command=command)
+    
     def set_options(self, options: List[str], default_value: Optional[str] = None) -> None:
         """设置选项列表"""
         self._options = options